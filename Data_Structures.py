@@ -1,5 +1,6 @@
 from enum import Enum, StrEnum
 from pydantic import BaseModel
+from pydantic_core import core_schema
 from typing import Optional, Dict, List, Any
 # from Contracts.Contract_File_IO import FileImporter
 from Utilities.File_IO import FileImporter
@@ -111,7 +112,91 @@ class SubscriptionConfig(BaseModel):
     env: EnvConfig
 
 
-@FileImporter(file_path="C:\\Users\\deepa\\Documents\\Automation_QA\\QAPlay\\InputFiles\\data1.xlsx")
+class LazyEnvConfig:
+    # Keeps each env section as raw TOML data and validates it on first access
+    __slots__ = ('_raw', '_validated')
+
+    _env_models = {
+        'prod': SubscriptionConfig.ProdEnvConfig,
+        'stage': SubscriptionConfig.StageEnvConfig,
+        'dev': SubscriptionConfig.DevEnvConfig,
+    }
+
+    def __init__(self, raw: Optional[Dict[str, Any]] = None):
+        self._raw = {env: data for env, data in (raw or {}).items() if env in self._env_models}
+        self._validated = {}
+
+    def _section(self, env: str):
+        if env not in self._validated:
+            data = self._raw.get(env)
+            self._validated[env] = None if data is None else self._env_models[env].model_validate(data)
+        return self._validated[env]
+
+    @property
+    def prod(self) -> Optional[SubscriptionConfig.ProdEnvConfig]:
+        return self._section('prod')
+
+    @property
+    def stage(self) -> Optional[SubscriptionConfig.StageEnvConfig]:
+        return self._section('stage')
+
+    @property
+    def dev(self) -> Optional[SubscriptionConfig.DevEnvConfig]:
+        return self._section('dev')
+
+    @property
+    def envs(self) -> List[str]:
+        return list(self._raw)
+
+    def materialize(self) -> SubscriptionConfig.EnvConfig:
+        return SubscriptionConfig.EnvConfig(prod=self.prod, stage=self.stage, dev=self.dev)
+
+    def __getstate__(self):
+        return self._raw, self._validated
+
+    def __setstate__(self, state):
+        self._raw, self._validated = state
+
+    def __eq__(self, other):
+        if isinstance(other, LazyEnvConfig):
+            return self._raw == other._raw
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyEnvConfig(envs={self.envs})"
+
+    @classmethod
+    def _coerce(cls, value):
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, SubscriptionConfig.EnvConfig):
+            lazy = cls()
+            for env in cls._env_models:
+                if getattr(value, env) is not None:
+                    lazy._raw[env] = getattr(value, env).model_dump()
+                    lazy._validated[env] = getattr(value, env)
+            return lazy
+        if isinstance(value, dict):
+            return cls(value)
+        raise ValueError(f"env must be a dict of env sections, got {type(value).__name__}")
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source, handler):
+        return core_schema.no_info_plain_validator_function(
+            cls._coerce,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda value: value.materialize().model_dump()))
+
+    @classmethod
+    def __get_pydantic_json_schema__(cls, schema, handler):
+        return handler(SubscriptionConfig.EnvConfig.__pydantic_core_schema__)
+
+
+class LazySubscriptionConfig(SubscriptionConfig):
+    env: LazyEnvConfig
+
+
+@FileImporter(file_path="C:\\Users\\deepa\\Documents\\Automation_QA\\QAPlay\\InputFiles\\data1.xlsx", cache=True)
 class DataFileImport(BaseModel):
     name: str
     prod: Optional[int] = None
@@ -1,5 +1,5 @@
 import timeit
-from typing import Any, List, Optional, Tuple, Type
+from typing import Any, Dict, List, Optional, Tuple, Type
 import pandas as pd
 import os
 import json
@@ -45,11 +45,24 @@ class FileImporter:
         '.json': JSONFileReader(),
     }
 
+    # Pydantic model per decorated class, compiled on first import and reused afterwards
+    _compiled_models: Dict[type, Type[BaseModel]] = {}
+
     def __init__(self, file_path: Optional[str] = None):
         self.file_path = file_path
 
-    def __call__(self, cls):
+    @classmethod
+    def _compile(cls, model_cls) -> Type[BaseModel]:
+        compiled = cls._compiled_models.get(model_cls)
+        if compiled is None:
+            # Dynamically create a Pydantic model based on the annotations
+            class DynamicModel(BaseModel, model_cls):
+                pass
 
+            compiled = cls._compiled_models[model_cls] = DynamicModel
+        return compiled
+
+    def __call__(self, cls):
 
         def wrapper(*args, **kwargs):
             filepath = kwargs.get('filepath', self.file_path)
@@ -64,20 +77,13 @@ class FileImporter:
                 raise ValueError(
                     f"Unsupported file format {file_extension}. Please upload an Excel, CSV, or JSON file.")
 
-            # Dynamically create a Pydantic model based on the annotations
-            class DynamicModel(BaseModel, cls):
-
-                def __call__(self, *args, **kwargs):
-                    for field, field_type in cls.__annotations__.items():
-                        DynamicModel.__annotations__[field] = field_type
-
-                    df = reader.read(filepath)
-                    df = df.replace({pd.NA: None})
-                    df = self._validate_headers(df, list(cls.__annotations__.keys()))
-                    return self._validate_inputs(cls, df)
+            model = self._compile(cls)
+            df = reader.read(filepath)
+            df = df.replace({pd.NA: None})
+            df = self._validate_headers(df, list(cls.__annotations__.keys()))
+            return self._validate_inputs(model, df)
 
-            return DynamicModel()
-        cls.import_file = wrapper()
+        cls.import_file = wrapper
         return cls
 
     @staticmethod
@@ -89,16 +95,16 @@ class FileImporter:
         return df[expected_columns]
 
     @staticmethod
-    def _validate_inputs(cls, df: pd.DataFrame) -> Tuple[List[Any], List[dict[str, Any]]]:
+    def _validate_inputs(model: Type[BaseModel], df: pd.DataFrame) -> Tuple[List[Any], List[dict[str, Any]]]:
         valid_data = []
         errors = []
 
         for index, row in df.iterrows():
             row_dict = row.to_dict()
-            # Filter out keys that are not attributes of DynamicModel
-            filtered_row_dict = {key: value for key, value in row_dict.items() if key in DynamicModel.__annotations__}
+            # Filter out keys that are not fields of the compiled model
+            filtered_row_dict = {key: value for key, value in row_dict.items() if key in model.model_fields}
             try:
-                file_row = cls(**filtered_row_dict)
+                file_row = model(**filtered_row_dict)
                 valid_data.append(file_row)
             except ValidationError as e:
                 errors.append({'index': index, 'error': str(e)})
@@ -138,7 +144,7 @@ class DataFileImport:
 
 def main():
     try:
-        data = DataFileImport()
+        data, errors = DataFileImport.import_file()
         print(f"Validated data: {data}")
     #     if errors:
     #         print(f"Validation errors:")
@@ -1,49 +1,918 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import glob
+import hashlib
+import importlib
+import importlib.util
+import inspect
 import json
+import marshal
 import os
-from concurrent.futures import ThreadPoolExecutor
-from typing import List, Dict
-import numpy as np
-import pandas as pd
-import toml
-from pydantic import ValidationError
+import pickle
+import sys
+import threading
+from array import array
+from collections.abc import MutableMapping, Sequence as SequenceABC
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+from types import UnionType
+from typing import Annotated, List, Dict, Any, AsyncIterator, Hashable, Iterator, Optional, Sequence, Tuple, Union, get_origin
+from pydantic import TypeAdapter, ValidationError, WrapValidator
+
+
+class _LazyModule:
+    # The module is only imported on first attribute access, a short CLI run or page load that never
+    # reads a file does not pay for importing pandas. The import is a regular one under a lock,
+    # importlib.util.LazyLoader is not thread-safe and pool workers reading files at once saw a
+    # half-initialised pandas without read_csv
+    def __init__(self, name: str, alias: str):
+        self._name = name
+        self._alias = alias
+        self._lock = threading.Lock()
+
+    def __getattr__(self, attr: str):
+        with self._lock:
+            module = importlib.import_module(self._name)
+        # Later lookups of the module global hit the real module
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+
+def _lazy_import(name: str, alias: Optional[str] = None):
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    if importlib.util.find_spec(name) is None:
+        raise ImportError(f"No module named '{name}'")
+    return _LazyModule(name, alias or name)
+
+
+np = _lazy_import('numpy', 'np')
+pd = _lazy_import('pandas', 'pd')
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+    toml = _lazy_import('toml')
+
+# (row index, records) pairs produced by FileReader.iter_records
+RecordChunks = Iterator[Tuple[Sequence[Hashable], List[Dict]]]
+
+
+def restore_models(ModelClass, states: List[dict]) -> list:
+    # Rebuilds already validated models from their pickled state without validating again
+    models = []
+    for state in states:
+        model = ModelClass.__new__(ModelClass)
+        model.__setstate__(state)
+        models.append(model)
+    return models
+
+
+def _resolve_model(module_name: str, qualname: str):
+    target = importlib.import_module(module_name)
+    for part in qualname.split('.'):
+        target = getattr(target, part)
+    # FileImporter replaces the decorated class with its wrapper, the model itself hangs off it
+    return getattr(target, 'model', target)
+
+
+def _validate_block(module_name: str, qualname: str, records: List[Dict[str, Any]], index: List[Hashable],
+                    max_errors: Optional[int] = None):
+    ModelClass = _resolve_model(module_name, qualname)
+    valid_data, errors = Validator.validate_records(records, ModelClass, index, max_errors)
+    return [row.__getstate__() for row in valid_data], errors
+
+
+async def _aiterate(iterator: Iterator) -> AsyncIterator:
+    # Each next() runs in a worker thread so a slow read never blocks the event loop
+    done = object()
+    try:
+        while True:
+            item = await asyncio.to_thread(next, iterator, done)
+            if item is done:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, 'close', None)
+        if close is not None:
+            await asyncio.to_thread(close)
+
+
+# Parsed TOML per absolute path as ((mtime_ns, size), pickled data), shared by every caller in the process
+_toml_cache: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+
+
+def load_toml(file_path: str) -> Dict[str, Any]:
+    path = os.path.abspath(file_path)
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _toml_cache.get(path)
+    if cached is None or cached[0] != version:
+        if tomllib is not None:
+            with open(path, 'rb') as f:
+                data = tomllib.load(f)
+        else:
+            with open(path, 'r') as f:
+                data = toml.load(f)
+        cached = (version, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        _toml_cache[path] = cached
+    # Every caller gets its own copy to modify, unpickling is much cheaper than parsing again
+    return pickle.loads(cached[1])
+
+
+def _nan_to_none(df: pd.DataFrame) -> pd.DataFrame:
+    # replace(np.nan, None) cannot store None in typed columns such as Int64 or string, object columns can
+    return df.astype(object).where(df.notna(), None)
+
+
+def _is_missing(value) -> bool:
+    return value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value)
+
+
+def _clean_records(records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # Same result as a DataFrame round trip: NaN and NA become None, keys another record has are filled with None
+    columns = dict.fromkeys(key for record in records for key in record)
+    cleaned = []
+    for record in records:
+        if len(record) != len(columns) or any(_is_missing(value) for value in record.values()):
+            record = {column: None if _is_missing(value := record.get(column)) else value for column in columns}
+        cleaned.append(record)
+    return cleaned
+
+
+def _column_records(data: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+    # A dict of equal length lists or 1-d arrays is one column per key, a dict of scalars is a single row.
+    # Arrays become lists of Python scalars, as the DataFrame records they replace would hold
+    values = [value.tolist() if isinstance(value, np.ndarray) and value.ndim == 1 else value
+              for value in data.values()]
+    if all(isinstance(value, (list, tuple, range)) for value in values):
+        if len({len(value) for value in values}) > 1:
+            return None
+        return [dict(zip(data, row)) for row in zip(*values)]
+    if not any(isinstance(value, (list, tuple, range, dict, pd.Series, np.ndarray)) for value in values):
+        return [dict(data)]
+    # Nested dicts carry their own row labels, those still go through pandas
+    return None
+
+
+def _sheet_names(available: List[str], sheets) -> List[str]:
+    # sheets is '*' for every sheet, a sheet name or position, or a list of them
+    if sheets == '*':
+        return list(available)
+    names = []
+    for sheet in (sheets if isinstance(sheets, (list, tuple)) else [sheets]):
+        if isinstance(sheet, int) and 0 <= sheet < len(available):
+            sheet = available[sheet]
+        if sheet not in available:
+            raise ValueError(f"Sheet {sheet!r} not found. Available sheets: {available}")
+        names.append(sheet)
+    return names
+
+
+def _text_dtypes(dtypes: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    # Text columns cannot fail to parse, so a retry after a bad numeric cell keeps them typed
+    text_dtypes = {column: dtype for column, dtype in (dtypes or {}).items() if dtype == 'string'}
+    return text_dtypes or None
+
+
+def _usecols(columns: Optional[List[str]]):
+    # A callable keeps pandas from failing on model columns the file does not have
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return lambda column: column in wanted
 
 
 class FileReader:
-    def read(self, file_path: str) -> pd.DataFrame:
+    # Readers that produce records natively skip the DataFrame entirely for batch validation
+    native_records = False
+
+    def read(self, file_path: str, columns: Optional[List[str]] = None,
+             dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        # columns and dtypes are hints, readers that can project or type columns at parse time do so
         try:
-            return self._read_file(file_path)
+            return self._read_file(file_path, columns, dtypes)
         except Exception as e:
+            if dtypes and _text_dtypes(dtypes) != dtypes:
+                # A cell that does not fit its column type should fail on its row, not for the whole file
+                return self.read(file_path, columns, _text_dtypes(dtypes))
             raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
 
-    def _read_file(self, file_path: str) -> pd.DataFrame:
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
         raise NotImplementedError
 
+    def iter_records(self, file_path: str, chunk_size: int, columns: Optional[List[str]] = None,
+                     dtypes: Optional[Dict[str, str]] = None) -> RecordChunks:
+        # Readers without a native chunked mode still load the file once, but hand it out in slices
+        df = self.read(file_path, columns, dtypes)
+        for start in range(0, len(df), chunk_size):
+            chunk = _nan_to_none(df.iloc[start:start + chunk_size])
+            yield chunk.index, chunk.to_dict('records')
+
 
 class ExcelFileReader(FileReader):
-    def _read_file(self, file_path: str) -> pd.DataFrame:
-        return pd.read_excel(file_path, engine='openpyxl')
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        return pd.read_excel(file_path, engine='openpyxl', usecols=_usecols(columns), dtype=dtypes)
+
+    def read_sheets(self, file_path: str, sheets, columns: Optional[List[str]] = None,
+                    dtypes: Optional[Dict[str, str]] = None) -> Dict[str, Tuple[Sequence[Hashable], List[Dict]]]:
+        # The workbook is opened once and every selected sheet is parsed from it
+        try:
+            with pd.ExcelFile(file_path, engine='openpyxl') as workbook:
+                sheet_records = {}
+                for name in _sheet_names(workbook.sheet_names, sheets):
+                    try:
+                        df = workbook.parse(name, usecols=_usecols(columns), dtype=dtypes)
+                    except Exception:
+                        if not dtypes or _text_dtypes(dtypes) == dtypes:
+                            raise
+                        df = workbook.parse(name, usecols=_usecols(columns), dtype=_text_dtypes(dtypes))
+                    df = _nan_to_none(df)
+                    sheet_records[name] = (df.index, df.to_dict('records'))
+                return sheet_records
+        except Exception as e:
+            raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
+
+
+class ExcelStreamFileReader(ExcelFileReader):
+    native_records = True
+
+    def iter_records(self, file_path: str, chunk_size: int, columns: Optional[List[str]] = None,
+                     dtypes: Optional[Dict[str, str]] = None) -> RecordChunks:
+        try:
+            workbook, handle = self._open_workbook(file_path)
+        except Exception as e:
+            raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
+
+        try:
+            yield from self._iter_worksheet(workbook.worksheets[0], chunk_size, columns, dtypes)
+        finally:
+            workbook.close()
+            handle.close()
+
+    def read_sheets(self, file_path: str, sheets, columns: Optional[List[str]] = None,
+                    dtypes: Optional[Dict[str, str]] = None) -> Dict[str, Tuple[Sequence[Hashable], List[Dict]]]:
+        try:
+            workbook, handle = self._open_workbook(file_path)
+        except Exception as e:
+            raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
+
+        # Read-only worksheets stream from the one open workbook, one sheet after another
+        try:
+            sheet_records = {}
+            for name in _sheet_names(workbook.sheetnames, sheets):
+                index, records = [], []
+                for chunk_index, chunk_records in self._iter_worksheet(workbook[name], 1 << 16, columns, dtypes):
+                    index.extend(chunk_index)
+                    records.extend(chunk_records)
+                sheet_records[name] = (index, records)
+            return sheet_records
+        finally:
+            workbook.close()
+            handle.close()
+
+    @staticmethod
+    def _open_workbook(file_path: str):
+        from openpyxl import load_workbook
+
+        # openpyxl refuses paths that do not end in .xlsx, a file object lets sniffed workbooks through
+        handle = open(file_path, 'rb')
+        try:
+            return load_workbook(handle, read_only=True, data_only=True), handle
+        except Exception:
+            handle.close()
+            raise
+
+    @staticmethod
+    def _iter_worksheet(worksheet, chunk_size: int, columns: Optional[List[str]] = None,
+                        dtypes: Optional[Dict[str, str]] = None) -> RecordChunks:
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        wanted = set(header if columns is None else columns)
+        columns = [(position, column) for position, column in enumerate(header)
+                   if column is not None and column in wanted]
+        # openpyxl already types numbers and dates, only text columns need converting
+        text_columns = {column for column, dtype in (dtypes or {}).items() if dtype == 'string'}
+
+        def sheet_records():
+            # Like the pandas reader, blank rows between data rows are kept as empty records and
+            # trailing blank rows are dropped, so both readers report the same rows
+            blank = []
+            for position, values in enumerate(rows):
+                if all(value is None for value in values):
+                    blank.append(position)
+                    continue
+                for blank_position in blank:
+                    yield blank_position, dict.fromkeys(column for _, column in columns)
+                blank = []
+                record = {column: values[i] if i < len(values) else None for i, column in columns}
+                for column in text_columns:
+                    if record.get(column) is not None and not isinstance(record[column], str):
+                        record[column] = str(record[column])
+                yield position, record
+
+        index, records = [], []
+        for position, record in sheet_records():
+            index.append(position)
+            records.append(record)
+            if len(records) == chunk_size:
+                yield index, records
+                index, records = [], []
+        if records:
+            yield index, records
 
 
 class CSVFileReader(FileReader):
-    def _read_file(self, file_path: str) -> pd.DataFrame:
-        return pd.read_csv(file_path, low_memory=False)
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        return pd.read_csv(file_path, low_memory=False, usecols=_usecols(columns), dtype=dtypes)
+
+    def iter_records(self, file_path: str, chunk_size: int, columns: Optional[List[str]] = None,
+                     dtypes: Optional[Dict[str, str]] = None) -> RecordChunks:
+        try:
+            # Only text dtypes are pushed into chunked reads, they cannot fail halfway through the file
+            with pd.read_csv(file_path, chunksize=chunk_size, low_memory=False, usecols=_usecols(columns),
+                             dtype=_text_dtypes(dtypes)) as chunks:
+                for chunk in chunks:
+                    chunk = _nan_to_none(chunk)
+                    yield chunk.index, chunk.to_dict('records')
+        except (OSError, pd.errors.ParserError) as e:
+            raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
 
 
 class JSONFileReader(FileReader):
-    def _read_file(self, file_path: str) -> pd.DataFrame:
+    native_records = True
+    block_size = 1 << 16
+
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
         with open(file_path, 'r') as f:
             data = json.load(f)
             return pd.DataFrame(data)
 
+    def iter_records(self, file_path: str, chunk_size: int, columns: Optional[List[str]] = None,
+                     dtypes: Optional[Dict[str, str]] = None) -> RecordChunks:
+        try:
+            with open(file_path, 'r') as f:
+                # Leading whitespace may fill whole blocks
+                buffer = ''
+                while not buffer:
+                    block = f.read(self.block_size)
+                    if not block:
+                        break
+                    buffer = block.lstrip()
+                if not buffer.startswith('['):
+                    # Column-oriented or single-object JSON has no row stream, load it the regular way
+                    yield from super().iter_records(file_path, chunk_size, columns, dtypes)
+                    return
+                yield from self._iter_array(f, buffer[1:], chunk_size)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
+
+    def _iter_array(self, f, buffer: str, chunk_size: int) -> RecordChunks:
+        # Decodes one array element at a time, only the current block and chunk are held in memory
+        decoder = json.JSONDecoder()
+        position, eof, row = 0, False, 0
+        index, records = [], []
+        while True:
+            while position < len(buffer) and buffer[position] in ' \t\r\n,':
+                position += 1
+            if position == len(buffer) and not eof:
+                buffer, position = f.read(self.block_size), 0
+                eof = not buffer
+                continue
+            if position < len(buffer) and buffer[position] == ']':
+                break
+            try:
+                record, end = decoder.raw_decode(buffer, position)
+                # A value is only complete once the delimiter after it was read, a number cut at the end of
+                # a block decodes as a shorter one, e.g. 0 of 0.5
+                delimiter = end
+                while delimiter < len(buffer) and buffer[delimiter] in ' \t\r\n':
+                    delimiter += 1
+                complete = delimiter < len(buffer) and buffer[delimiter] in ',]'
+                if eof and not complete:
+                    error = json.JSONDecodeError("Expecting ',' delimiter", buffer, delimiter)
+            except json.JSONDecodeError as e:
+                complete, error = False, e
+            if not complete:
+                if eof:
+                    raise error
+                block = f.read(self.block_size)
+                eof = not block
+                buffer, position = buffer[position:] + block, 0
+                continue
+
+            index.append(row)
+            records.append(record)
+            position, row = end, row + 1
+            if len(records) == chunk_size:
+                yield index, records
+                index, records = [], []
+        if records:
+            yield index, records
+
+
+class NDJSONFileReader(FileReader):
+    native_records = True
+
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        return pd.read_json(file_path, lines=True)
+
+    def iter_records(self, file_path: str, chunk_size: int, columns: Optional[List[str]] = None,
+                     dtypes: Optional[Dict[str, str]] = None) -> RecordChunks:
+        try:
+            with open(file_path, 'r') as f:
+                index, records = [], []
+                # The index is the line position, so error rows point at the line in the file
+                for position, line in enumerate(f):
+                    if not line.strip():
+                        continue
+                    index.append(position)
+                    records.append(json.loads(line))
+                    if len(records) == chunk_size:
+                        yield index, records
+                        index, records = [], []
+                if records:
+                    yield index, records
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
+
+
+class ParquetFileReader(FileReader):
+    native_records = True
+
+    @staticmethod
+    def _project(file_path: str, columns: Optional[List[str]]) -> Optional[List[str]]:
+        import pyarrow.parquet as pq
+
+        if columns is None:
+            return None
+        # Missing optional columns are left to the model defaults, as with a full read
+        available = set(pq.read_schema(file_path).names)
+        return [column for column in columns if column in available]
+
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        return pd.read_parquet(file_path, columns=self._project(file_path, columns))
+
+    def iter_records(self, file_path: str, chunk_size: int, columns: Optional[List[str]] = None,
+                     dtypes: Optional[Dict[str, str]] = None) -> RecordChunks:
+        import pyarrow.parquet as pq
+
+        try:
+            parquet_file = pq.ParquetFile(file_path)
+            batches = parquet_file.iter_batches(batch_size=chunk_size, columns=self._project(file_path, columns))
+            start = 0
+            for batch in batches:
+                yield range(start, start + batch.num_rows), batch.to_pylist()
+                start += batch.num_rows
+        except Exception as e:
+            raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
+
+
+class FeatherFileReader(FileReader):
+    native_records = True
+
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        import pyarrow.feather as feather
+
+        table = feather.read_table(file_path, memory_map=True)
+        if columns is not None:
+            table = table.select([column for column in columns if column in table.column_names])
+        return table.to_pandas()
+
+    def iter_records(self, file_path: str, chunk_size: int, columns: Optional[List[str]] = None,
+                     dtypes: Optional[Dict[str, str]] = None) -> RecordChunks:
+        import pyarrow.feather as feather
+
+        try:
+            # Memory mapping keeps unselected columns on disk, only projected buffers are touched
+            table = feather.read_table(file_path, memory_map=True)
+            if columns is not None:
+                table = table.select([column for column in columns if column in table.column_names])
+            for start in range(0, table.num_rows, chunk_size):
+                chunk = table.slice(start, chunk_size)
+                yield range(start, start + chunk.num_rows), chunk.to_pylist()
+        except Exception as e:
+            raise ValueError(f"Error reading {self.__class__.__name__}: {e}")
+
 
 class TomlFileReader(FileReader):
-    def _read_file(self, file_path: str) -> pd.DataFrame:
-        with open(file_path, 'r') as f:
-            x = toml.load(f)
-            return toml.load(f)
+    # A TOML file is one document, read() hands back its dict rather than a DataFrame
+    def _read_file(self, file_path: str, columns: Optional[List[str]] = None,
+                   dtypes: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        return load_toml(file_path)
+
+
+# Leading bytes of the binary formats, matched before the file extension is trusted
+_MAGIC_BYTES = [
+    (b'PK\x03\x04', '.xlsx'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', '.xls'),
+    (b'PAR1', '.parquet'),
+    (b'ARROW1', '.arrow'),
+]
+# Extensions that name the same format as another one
+_FORMAT_ALIASES = {'.xlsm': '.xlsx', '.feather': '.arrow', '.jsonl': '.ndjson'}
+_TEXT_FORMATS = {'.csv', '.json', '.ndjson', '.jsonl', '.toml'}
+
+
+def sniff_format(file_path: str) -> Optional[str]:
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(4096)
+    except OSError:
+        return None
+    for magic, extension in _MAGIC_BYTES:
+        if head.startswith(magic):
+            return extension
+    if b'\x00' in head:
+        return None
+
+    text = head.lstrip(b'\xef\xbb\xbf \t\r\n')
+    if text.startswith(b'['):
+        return '.json'
+    if text.startswith(b'{'):
+        first_line, _, rest = text.partition(b'\n')
+        try:
+            json.loads(first_line)
+        except ValueError:
+            # A pretty-printed object spans several lines, its first line is not JSON on its own
+            return '.json'
+        return '.ndjson' if rest.strip() else '.json'
+    first_line = text.partition(b'\n')[0]
+    if any(delimiter in first_line for delimiter in (b',', b';', b'\t')):
+        return '.csv'
+    return None
+
+
+class ReaderRegistry(MutableMapping):
+    """File readers by extension, each created on first use. Other packages add readers through the
+    'html_reporter.file_readers' entry point group, named after the extension and pointing at a reader class."""
+
+    entry_point_group = 'html_reporter.file_readers'
+
+    def __init__(self, readers: Dict[str, Any]):
+        # Values are reader classes, reader instances or 'module:Class' paths
+        self._factories = dict(readers)
+        self._builtin = set(readers)
+        self._readers = {}
+        self._entry_points_loaded = False
+
+    def _load_entry_points(self):
+        # Scanning installed distributions is slow, it only happens for an extension no built-in reader has
+        if self._entry_points_loaded:
+            return
+        self._entry_points_loaded = True
+        from importlib.metadata import entry_points
+        for entry_point in entry_points(group=self.entry_point_group):
+            extension = entry_point.name.lower()
+            self._factories.setdefault(extension if extension.startswith('.') else f".{extension}", entry_point)
+
+    def is_builtin(self, extension: str) -> bool:
+        return extension in self._builtin
+
+    def __getitem__(self, extension: str):
+        reader = self._readers.get(extension)
+        if reader is not None:
+            return reader
+        if extension not in self._factories:
+            self._load_entry_points()
+        factory = self._factories[extension]
+        if isinstance(factory, str):
+            module_name, _, name = factory.partition(':')
+            factory = getattr(importlib.import_module(module_name), name)
+        elif not isinstance(factory, (type, FileReader)):
+            # An entry point, loading it imports the package that provides the reader
+            factory = factory.load()
+        reader = factory() if isinstance(factory, type) else factory
+        self._readers[extension] = reader
+        return reader
+
+    def __setitem__(self, extension: str, reader):
+        self._factories[extension] = reader
+        self._readers.pop(extension, None)
+
+    def __delitem__(self, extension: str):
+        del self._factories[extension]
+        self._readers.pop(extension, None)
+        self._builtin.discard(extension)
+
+    def __contains__(self, extension) -> bool:
+        if extension not in self._factories:
+            self._load_entry_points()
+        return extension in self._factories
+
+    def __iter__(self):
+        self._load_entry_points()
+        return iter(list(self._factories))
+
+    def __len__(self) -> int:
+        self._load_entry_points()
+        return len(self._factories)
+
+
+class ValidationErrors(SequenceABC):
+    """Validation errors kept as parallel arrays, each error is only built into a dict when accessed.
+
+    The FileImporter wrappers return errors as a plain list of dicts, compact_errors=True returns this instead."""
+
+    def __init__(self):
+        self.rows = array('q')
+        self.columns = []
+        self.codes = []
+        self.messages = []
+        self.actuals = []
+        # Source file and sheet per error, only kept once errors from several files or sheets are merged
+        self.sources = None
+        self.sheets = None
+        self._expected = {}
+        self._strings = {}
+
+    def _intern(self, value):
+        # Columns, codes and most messages repeat across rows, one shared string each is enough
+        return self._strings.setdefault(value, value) if isinstance(value, str) else value
+
+    def append(self, row: int, column: Optional[str], code: Optional[str], message: str, actual: Any,
+               expected: Any = None):
+        self.rows.append(row)
+        self.columns.append(self._intern(column))
+        self.codes.append(self._intern(code))
+        self.messages.append(self._intern(message))
+        self.actuals.append(actual)
+        self._expected.setdefault(column, expected)
+
+    def extend(self, errors, source: Optional[str] = None, sheet: Optional[str] = None):
+        start = len(self)
+        self._extend(errors)
+        self.sources = self._tag(self.sources, getattr(errors, 'sources', None), source, start)
+        self.sheets = self._tag(self.sheets, getattr(errors, 'sheets', None), sheet, start)
+
+    def _tag(self, tags: Optional[list], error_tags: Optional[list], tag: Optional[str], start: int):
+        # The given tag wins over the tags the merged errors already carry
+        if tag is None and tags is None and error_tags is None:
+            return None
+        if tags is None:
+            tags = [None] * start
+        if tag is None and error_tags is not None:
+            tags.extend(error_tags)
+        else:
+            tags.extend([tag] * (len(self) - start))
+        return tags
+
+    def _extend(self, errors):
+        if isinstance(errors, ValidationErrors):
+            self.rows.extend(errors.rows)
+            self.columns.extend(errors.columns)
+            self.codes.extend(errors.codes)
+            self.messages.extend(errors.messages)
+            self.actuals.extend(errors.actuals)
+            for column, expected in errors._expected.items():
+                self._expected.setdefault(column, expected)
+            return
+        for error in errors:
+            self.append(error['row'], error['column'], error.get('code'), error['message'], error['actual'],
+                        error['expected'])
+
+    def truncate(self, size: int):
+        del self.rows[size:], self.columns[size:], self.codes[size:], self.messages[size:], self.actuals[size:]
+        if self.sources is not None:
+            del self.sources[size:]
+        if self.sheets is not None:
+            del self.sheets[size:]
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        column = self.columns[position]
+        error = {
+            'row': self.rows[position],
+            'column': column,
+            'message': self.messages[position],
+            'expected': self._expected.get(column),
+            'actual': self.actuals[position]
+        }
+        if self.sources is not None:
+            error['file'] = self.sources[position]
+        if self.sheets is not None:
+            error['sheet'] = self.sheets[position]
+        return error
+
+    def __eq__(self, other):
+        if isinstance(other, SequenceABC) and not isinstance(other, str):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ValidationErrors({list(self)!r})"
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_strings')
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__dict__.setdefault('sheets', None)
+        self._strings = {}
+
+
+class RecordView:
+    """Read-only view of one row in a RecordStore, subclassed per model with one property per field."""
+    __slots__ = ('_store', '_position')
+
+    def __init__(self, store: 'RecordStore', position: int):
+        self._store = store
+        self._position = position
+
+    def to_model(self):
+        return self._store.model(self._position)
+
+    def __eq__(self, other):
+        if isinstance(other, RecordView):
+            return self.to_model() == other.to_model()
+        return self.to_model() == other
+
+    def __repr__(self) -> str:
+        values = ', '.join(f"{name}={getattr(self, name)!r}" for name in self._store.fields)
+        return f"{type(self).__name__}({values})"
+
+
+def _field_property(name: str) -> property:
+    return property(lambda view: view._store.value(name, view._position))
+
+
+class RecordStore(SequenceABC):
+    """Validated rows kept column by column in nullable pandas arrays instead of one model object per row."""
+
+    _view_classes = {}
+
+    def __init__(self, ModelClass, models=()):
+        self.model_class = ModelClass
+        self.fields = list(ModelClass.model_fields)
+        self._dtypes = {name: Validator.pandas_dtype(field.annotation) or object
+                        for name, field in ModelClass.model_fields.items()}
+        self._chunks = []
+        self._frame = None
+        self._columns = None
+        self._view = self._view_class(ModelClass)
+        self.extend(models)
+
+    @classmethod
+    def from_frame(cls, ModelClass, frame: pd.DataFrame) -> 'RecordStore':
+        # The frame holds already validated columns, e.g. one restored from the import cache
+        store = cls(ModelClass)
+        store._chunks = [frame]
+        return store
+
+    @classmethod
+    def _view_class(cls, ModelClass):
+        view = cls._view_classes.get(ModelClass)
+        if view is None:
+            attributes = {name: _field_property(name) for name in ModelClass.model_fields}
+            view = type(f"{ModelClass.__name__}Row", (RecordView,), {'__slots__': (), **attributes})
+            cls._view_classes[ModelClass] = view
+        return view
+
+    def extend(self, models):
+        if isinstance(models, RecordStore):
+            self._chunks.extend(models._chunks if models._frame is None else [models._frame])
+        else:
+            models = list(models)
+            if not models:
+                return
+            # The models of a chunk can be freed as soon as their values are copied into columns
+            self._chunks.append(pd.DataFrame({
+                name: self._column([getattr(model, name) for model in models], dtype)
+                for name, dtype in self._dtypes.items()
+            }))
+        self._frame = None
+        self._columns = None
+
+    @staticmethod
+    def _column(values: list, dtype):
+        try:
+            if dtype == 'Float64':
+                # pd.array reads NaN as missing, the mask is built by hand so a valid NaN stays NaN
+                data = np.array([0.0 if value is None else value for value in values], dtype='float64')
+                return pd.arrays.FloatingArray(data, np.array([value is None for value in values]))
+            return pd.array(values, dtype=dtype)
+        except (TypeError, ValueError, OverflowError):
+            # Values the nullable dtype cannot hold, e.g. ints beyond int64, keep their Python objects
+            return pd.array(values, dtype=object)
+
+    def to_frame(self) -> pd.DataFrame:
+        if self._frame is None:
+            if not self._chunks:
+                self._frame = pd.DataFrame({name: pd.array([], dtype=dtype) for name, dtype in self._dtypes.items()})
+            elif len(self._chunks) == 1:
+                self._frame = self._chunks[0]
+            else:
+                self._frame = pd.concat(self._chunks, ignore_index=True)
+            self._chunks = [self._frame]
+        return self._frame
+
+    def value(self, name: str, position: int):
+        if self._columns is None:
+            frame = self.to_frame()
+            self._columns = {column: frame[column].array for column in self.fields}
+        value = self._columns[name][position]
+        # Nullable arrays hand back NA and numpy scalars, views return what the model attribute would hold
+        if value is pd.NA:
+            return None
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+    def model(self, position: int):
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("RecordStore index out of range")
+        # Values were validated before they were stored, so the model is built without validating again
+        return self.model_class.model_construct(**{name: self.value(name, position) for name in self.fields})
+
+    def to_models(self) -> list:
+        return [self.model(position) for position in range(len(self))]
+
+    def __len__(self) -> int:
+        if self._frame is not None:
+            return len(self._frame)
+        return sum(len(chunk) for chunk in self._chunks)
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("RecordStore index out of range")
+        return self._view(self, position)
+
+    def __repr__(self) -> str:
+        return f"RecordStore({self.model_class.__name__}, rows={len(self)})"
+
+
+class _RowFailure:
+    __slots__ = ('error',)
+
+    def __init__(self, error: ValidationError):
+        self.error = error
+
+
+def _catch_row_failure(value, handler):
+    # Wraps each list item, so one invalid row does not make the batch validate every valid row twice
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return _RowFailure(e)
 
 
 class Validator:
+    # One compiled list[Model] adapter per model class, shared by every batch call
+    _list_adapters: Dict[type, TypeAdapter] = {}
+
+    # Rows validated per call when an error budget is set, the budget is checked between batches
+    budget_batch_size = 1000
+
+    # Nullable pandas dtypes matching plain field annotations, anything else is left to inference
+    _pandas_dtypes = {int: 'Int64', float: 'Float64', bool: 'boolean', str: 'string'}
+
+    @staticmethod
+    def model_columns(ModelClass) -> List[str]:
+        return [field.alias or name for name, field in ModelClass.model_fields.items()]
+
+    @classmethod
+    def pandas_dtype(cls, annotation) -> Optional[str]:
+        # Optional[X] is Union[X, None], unwrap it to X
+        args = [arg for arg in getattr(annotation, '__args__', ()) if arg is not type(None)]
+        if get_origin(annotation) in (Union, UnionType) and len(args) == 1:
+            annotation = args[0]
+        return cls._pandas_dtypes.get(annotation)
+
+    @classmethod
+    def model_dtypes(cls, ModelClass) -> Dict[str, str]:
+        dtypes = {}
+        for name, field in ModelClass.model_fields.items():
+            dtype = cls.pandas_dtype(field.annotation)
+            if dtype is not None:
+                dtypes[field.alias or name] = dtype
+        return dtypes
 
     @classmethod
     def validate_headers(cls, df: pd.DataFrame, expected_columns: List[str]) -> pd.DataFrame:
@@ -54,15 +923,133 @@ class Validator:
         return df[expected_columns]
 
     @classmethod
-    def validate_inputs_parallel(cls, df: pd.DataFrame, ModelClass):
+    def validate_inputs_parallel(cls, df: pd.DataFrame, ModelClass, max_errors: Optional[int] = None):
+        valid_data, errors = [], []
+        rows = df.iterrows()
+        # With a budget rows are submitted one batch at a time, so validation stops once the budget is spent
+        batch_size = len(df) if max_errors is None else cls.budget_batch_size
         with ThreadPoolExecutor() as executor:
-            futures = [executor.submit(cls.validate_row, row, ModelClass) for index, row in df.iterrows()]
-            results = [future.result() for future in futures]
+            while futures := [executor.submit(cls.validate_row, row, ModelClass)
+                              for index, row in islice(rows, batch_size)]:
+                for future in futures:
+                    model, row_errors = future.result()
+                    if model is not None:
+                        valid_data.append(model)
+                    errors.extend(row_errors or [])
+                if max_errors is not None and len(errors) >= max_errors:
+                    del errors[max_errors:]
+                    break
+        return valid_data, errors
 
-        valid_data = [result[0] for result in results if result[0] is not None]
-        errors = [error for result in results for error in (result[1] or [])]
+    @classmethod
+    def validate_inputs(cls, df: pd.DataFrame, ModelClass, executor: str = 'batch',
+                        max_errors: Optional[int] = None):
+        if executor == 'batch':
+            return cls.validate_inputs_batch(df, ModelClass, max_errors)
+        if executor == 'thread':
+            valid_data, error_list = cls.validate_inputs_parallel(df, ModelClass, max_errors)
+            errors = ValidationErrors()
+            errors.extend(error_list)
+            return valid_data, errors
+        if executor == 'process':
+            return cls.validate_inputs_process(df, ModelClass, max_errors=max_errors)
+        raise ValueError(f"Unsupported executor {executor!r}. Expected 'batch', 'thread' or 'process'.")
+
+    @classmethod
+    def validate_inputs_process(cls, df: pd.DataFrame, ModelClass, max_workers: Optional[int] = None,
+                                max_errors: Optional[int] = None):
+        module_name, qualname = ModelClass.__module__, ModelClass.__qualname__
+        try:
+            importable = _resolve_model(module_name, qualname) is ModelClass
+        except (ImportError, AttributeError):
+            importable = False
+        if not importable:
+            raise ValueError(f"{qualname} must be importable from {module_name} to validate with executor='process'")
+
+        records = df.to_dict('records')
+        index = list(df.index)
+        max_workers = max_workers or os.cpu_count() or 1
+        # A few contiguous blocks per worker keeps them busy when some blocks fail more than others
+        block_size = max(1, -(-len(records) // (max_workers * 4)))
+
+        valid_data, errors = [], ValidationErrors()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_validate_block, module_name, qualname,
+                                       records[start:start + block_size], index[start:start + block_size],
+                                       max_errors)
+                       for start in range(0, len(records), block_size)]
+            # Collecting in submission order keeps the original row order
+            for future in futures:
+                block_states, block_errors = future.result()
+                valid_data.extend(restore_models(ModelClass, block_states))
+                errors.extend(block_errors)
+                if max_errors is not None and len(errors) >= max_errors:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    errors.truncate(max_errors)
+                    break
         return valid_data, errors
 
+    @classmethod
+    def validate_inputs_batch(cls, df: pd.DataFrame, ModelClass, max_errors: Optional[int] = None):
+        return cls.validate_records(df.to_dict('records'), ModelClass, df.index, max_errors)
+
+    @classmethod
+    def validate_records(cls, records: List[Dict[str, Any]], ModelClass,
+                         index: Optional[Sequence[Hashable]] = None, max_errors: Optional[int] = None):
+        index = range(len(records)) if index is None else index
+        if max_errors is None:
+            return cls._validate_batch(records, ModelClass, index)
+
+        # With a budget the records go through in smaller batches so validation can stop once it is spent
+        valid_data, errors = [], ValidationErrors()
+        for start in range(0, len(records), cls.budget_batch_size):
+            stop = start + cls.budget_batch_size
+            batch_valid, batch_errors = cls._validate_batch(records[start:stop], ModelClass, index[start:stop])
+            valid_data.extend(batch_valid)
+            errors.extend(batch_errors)
+            if len(errors) >= max_errors:
+                errors.truncate(max_errors)
+                break
+        return valid_data, errors
+
+    @classmethod
+    def _validate_batch(cls, records: List[Dict[str, Any]], ModelClass, index: Sequence[Hashable]):
+        # One pass over the batch, rows that fail come back as _RowFailure instead of failing the whole list
+        results = cls._list_adapter(ModelClass).validate_python(records)
+        valid_data, errors = [], ValidationErrors()
+        expected = {}
+        for position, result in enumerate(results):
+            if not isinstance(result, _RowFailure):
+                valid_data.append(result)
+                continue
+            for error in result.error.errors():
+                # Model-level validators report no field location, there is no single column to blame
+                column = error['loc'][0] if error['loc'] else None
+                if column not in expected:
+                    expected[column] = cls._expected_type(ModelClass, column)
+                actual = records[position].get(column) if column is not None else records[position]
+                errors.append(index[position] + 1, column, error['type'], error['msg'], actual, expected[column])
+        return valid_data, errors
+
+    @classmethod
+    def _list_adapter(cls, ModelClass) -> TypeAdapter:
+        adapter = cls._list_adapters.get(ModelClass)
+        if adapter is None:
+            item = Annotated[ModelClass, WrapValidator(_catch_row_failure)]
+            adapter = cls._list_adapters[ModelClass] = TypeAdapter(List[item])
+        return adapter
+
+    @staticmethod
+    def _expected_type(ModelClass, column: Optional[str]):
+        expected_type = ModelClass.model_fields[column].annotation if column in ModelClass.model_fields else None
+        return getattr(expected_type, '__args__', expected_type)
+
+    @staticmethod
+    def check_fail_fast(errors):
+        if errors:
+            error = errors[0]
+            raise ValueError(f"Validation failed at row {error['row']}, column {error['column']}: {error['message']}")
+
     @staticmethod
     def validate_row(row, ModelClass):
         try:
@@ -83,64 +1070,531 @@ class Validator:
             return None, error_details
 
 
+class ImportCache:
+    """On-disk cache of validated imports keyed by file fingerprint and model schema."""
+
+    def __init__(self, cache_dir: str = '.cache', max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def _digest(*parts) -> str:
+        return hashlib.sha1('\x1f'.join(str(part) for part in parts).encode()).hexdigest()[:16]
+
+    @classmethod
+    def schema_hash(cls, ModelClass) -> str:
+        fields = [(name, repr(field)) for name, field in ModelClass.model_fields.items()]
+        decorators = ModelClass.__pydantic_decorators__
+        # Validator bodies are hashed too, an edited validator must not keep serving rows it would now reject
+        validators = sorted((name, cls._function_hash(decorator.func))
+                            for group in (decorators.validators, decorators.field_validators,
+                                          decorators.root_validators, decorators.model_validators)
+                            for name, decorator in group.items())
+        return cls._digest(ModelClass.__module__, ModelClass.__qualname__, fields, validators)
+
+    @staticmethod
+    def _function_hash(func) -> str:
+        code = getattr(getattr(func, '__func__', func), '__code__', None)
+        if code is None:
+            return repr(func)
+        return hashlib.sha1(marshal.dumps(code)).hexdigest()
+
+    def _path_prefix(self, file_path: str) -> str:
+        return self._digest(os.path.abspath(file_path))
+
+    def _entry_path(self, file_path: str, ModelClass) -> str:
+        stat = os.stat(file_path)
+        fingerprint = self._digest(stat.st_mtime_ns, stat.st_size, self.schema_hash(ModelClass))
+        return os.path.join(self.cache_dir, f"{self._path_prefix(file_path)}-{fingerprint}.pkl")
+
+    def _entries(self) -> List[os.DirEntry]:
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [entry for entry in os.scandir(self.cache_dir) if entry.name.endswith('.pkl')]
+
+    def get(self, file_path: str, ModelClass, columnar: bool = False):
+        if not os.path.isfile(file_path):
+            # Let the reader report missing or unreadable inputs the usual way
+            return None
+        entry_path = self._entry_path(file_path, ModelClass)
+        # Unpickling allocates one container per row, pausing the cyclic GC avoids repeated full scans
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(entry_path, 'rb') as f:
+                cached = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            os.remove(entry_path)
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if 'frame' in cached and not columnar:
+            # Building models from the columns is slower than importing the file again
+            return None
+        # Touching the entry keeps least-recently-used eviction based on mtime
+        os.utime(entry_path)
+        # Rows were validated before they were cached, so they are restored without validating again
+        if 'frame' in cached:
+            return RecordStore.from_frame(ModelClass, cached['frame']), cached['errors']
+        valid_data = restore_models(ModelClass, cached['valid_data'])
+        return (RecordStore(ModelClass, valid_data) if columnar else valid_data), cached['errors']
+
+    def put(self, file_path: str, ModelClass, valid_data, errors: list):
+        entry_path = self._entry_path(file_path, ModelClass)
+        if isinstance(valid_data, RecordStore):
+            # Columnar imports are cached as their columns, building a model per row just to pickle it
+            # cost as much as the import
+            data = {'frame': valid_data.to_frame()}
+        else:
+            data = {'valid_data': [row.__getstate__() for row in valid_data]}
+        try:
+            payload = pickle.dumps({**data, 'errors': errors}, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Older fingerprints of the same file can never be hit again
+        self.invalidate(file_path)
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(temp_path, entry_path)
+        self._evict()
+
+    def invalidate(self, file_path: Optional[str] = None) -> int:
+        prefix = f"{self._path_prefix(file_path)}-" if file_path else ''
+        removed = 0
+        for entry in self._entries():
+            if entry.name.startswith(prefix):
+                os.remove(entry.path)
+                removed += 1
+        return removed
+
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime_ns)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            total -= entry.stat().st_size
+            os.remove(entry.path)
+
+
+class RowIndex:
+    """Persisted content hash of every valid row in an input file, keyed on one column, so re-imports only
+    validate inserted or changed rows. Rows sharing a key are told apart by their occurrence, (key, n)."""
+
+    def __init__(self, cache_dir: str = '.cache', key: str = 'name'):
+        self.cache_dir = cache_dir
+        self.key = key
+
+    def _index_path(self, file_path: str, ModelClass) -> str:
+        # A schema change gets a new index, so every row is validated again against the new model
+        name = ImportCache._digest(os.path.abspath(file_path), self.key, ImportCache.schema_hash(ModelClass),
+                                   'occurrence')
+        return os.path.join(self.cache_dir, f"{name}.rows")
+
+    @staticmethod
+    def row_hash(record: Dict[str, Any]) -> str:
+        # Values are hashed as text, a column that reads as 1 in one run and '1' in the next is not a change
+        values = sorted((column, str(value)) for column, value in record.items())
+        return hashlib.sha1(repr(values).encode()).hexdigest()
+
+    def load(self, file_path: str, ModelClass) -> Dict[Hashable, Tuple[str, dict]]:
+        index_path = self._index_path(file_path, ModelClass)
+        try:
+            with open(index_path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            os.remove(index_path)
+            return {}
+
+    def save(self, file_path: str, ModelClass, rows: Dict[Hashable, Tuple[str, dict]]):
+        index_path = self._index_path(file_path, ModelClass)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = f"{index_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, index_path)
+
+    def invalidate(self, file_path: str, ModelClass):
+        try:
+            os.remove(self._index_path(file_path, ModelClass))
+        except FileNotFoundError:
+            pass
+
+    def update(self, file_path: str, chunks: RecordChunks, ModelClass, fail_fast: bool = False):
+        if self.key not in ModelClass.model_fields:
+            raise ValueError(f"Incremental import key '{self.key}' is not a field of {ModelClass.__name__}")
+
+        previous = self.load(file_path, ModelClass)
+        # Built from scratch, unchanged rows are restored from `previous`, which is never written to here
+        current, occurrences = {}, {}
+        valid_data, errors = [], ValidationErrors()
+        touched = []
+        for index, records in chunks:
+            slots, hashes, pending = [], [], []
+            for position, record in enumerate(records):
+                key = record.get(self.key)
+                occurrence = occurrences.get(key, 0)
+                occurrences[key] = occurrence + 1
+                slot = (key, occurrence)
+                row_hash = self.row_hash(record)
+                slots.append(slot)
+                hashes.append(row_hash)
+                # Rows whose key and content are already in the index are restored from it, the rest are validated
+                known = previous.get(slot)
+                if key is None or known is None or known[0] != row_hash:
+                    pending.append(position)
+
+            batch_valid, batch_errors = Validator.validate_records([records[position] for position in pending],
+                                                                   ModelClass,
+                                                                   [index[position] for position in pending])
+            if fail_fast:
+                Validator.check_fail_fast(batch_errors)
+            errors.extend(batch_errors)
+            failed_rows = {row - 1 for row in batch_errors.rows}
+            validated = iter(batch_valid)
+            pending = set(pending)
+
+            for position, slot in enumerate(slots):
+                if position not in pending:
+                    current[slot] = previous[slot]
+                    valid_data.extend(restore_models(ModelClass, [previous[slot][1]]))
+                    continue
+                if index[position] in failed_rows:
+                    continue
+                model = next(validated)
+                valid_data.append(model)
+                if slot[0] is None:
+                    continue
+                current[slot] = (hashes[position], model.__getstate__())
+                touched.append(slot[0])
+
+        self.save(file_path, ModelClass, current)
+        previous_keys = {key for key, _ in previous}
+        keys = {key for key, _ in current}
+        # A key that lost one of its rows but still has others is changed as well
+        touched.extend(key for key, _ in previous.keys() - current.keys() if key in keys)
+        touched = list(dict.fromkeys(touched))
+        diff = {
+            # A key that was invalid last time is not in the index and counts as added
+            'added': [key for key in touched if key not in previous_keys],
+            'changed': [key for key in touched if key in previous_keys],
+            # Rows that were deleted or no longer validate
+            'removed': [key for key in dict.fromkeys(key for key, _ in previous) if key not in keys],
+        }
+        return valid_data, errors, diff
+
+
 class FileImporter:
-    _file_readers = {
-        '.xlsx': ExcelFileReader(),
-        '.xls': ExcelFileReader(),
-        '.csv': CSVFileReader(),
-        '.json': JSONFileReader(),
-        '.toml': TomlFileReader()
-    }
-
-    def __init__(self, file_path=None):
+    _file_readers = ReaderRegistry({
+        '.xlsx': ExcelStreamFileReader,
+        '.xlsm': ExcelStreamFileReader,
+        '.xls': ExcelFileReader,
+        '.csv': CSVFileReader,
+        '.json': JSONFileReader,
+        '.parquet': ParquetFileReader,
+        '.arrow': FeatherFileReader,
+        '.feather': FeatherFileReader,
+        '.ndjson': NDJSONFileReader,
+        '.jsonl': NDJSONFileReader,
+        '.toml': TomlFileReader
+    })
+
+    def __init__(self, file_path=None, cache=False):
         self.file_path = file_path
+        self.cache = self._resolve_cache(cache)
+
+    @staticmethod
+    def _resolve_cache(cache) -> Optional[ImportCache]:
+        if cache is True:
+            return ImportCache()
+        return cache or None
+
+    @staticmethod
+    def _stream(reader: FileReader, filepath: str, cls, chunk_size: int, max_errors: Optional[int] = None,
+                fail_fast: bool = False, columnar: bool = False):
+        # Row numbers stay global because every chunk carries its position in the file
+        columns, dtypes = Validator.model_columns(cls), Validator.model_dtypes(cls)
+        for index, records in reader.iter_records(filepath, chunk_size, columns, dtypes):
+            valid_data, errors = Validator.validate_records(records, cls, index, max_errors)
+            if fail_fast:
+                Validator.check_fail_fast(errors)
+            yield (RecordStore(cls, valid_data) if columnar else valid_data), errors
+            if max_errors is not None:
+                max_errors -= len(errors)
+                if max_errors <= 0:
+                    return
+
+    def _import_file(self, reader: FileReader, filepath: str, cls, executor: str, chunk_size: int, cache,
+                     max_errors: Optional[int] = None, fail_fast: bool = False, columnar: bool = False):
+        if cache is not None:
+            cached = cache.get(filepath, cls, columnar)
+            if cached is not None:
+                return cached
+
+        if reader.native_records and executor == 'batch':
+            # Chunks go into the columnar store as they are validated, so only one chunk of models is alive
+            valid_data, errors = (RecordStore(cls) if columnar else []), ValidationErrors()
+            for chunk_valid, chunk_errors in self._stream(reader, filepath, cls, chunk_size, max_errors, fail_fast):
+                valid_data.extend(chunk_valid)
+                errors.extend(chunk_errors)
+        else:
+            # For other formats, assume they return a DataFrame
+            df = reader.read(filepath, Validator.model_columns(cls), Validator.model_dtypes(cls))
+            df = _nan_to_none(df)
+            valid_data, errors = Validator.validate_inputs(df, cls, executor, max_errors)
+            if fail_fast:
+                Validator.check_fail_fast(errors)
+            if columnar:
+                valid_data = RecordStore(cls, valid_data)
+
+        if cache is not None:
+            cache.put(filepath, cls, valid_data, errors)
+        return valid_data, errors
+
+    def _reader_for(self, filepath: str) -> Tuple[str, Optional[FileReader]]:
+        extension = os.path.splitext(filepath)[1].lower()
+        if extension in self._file_readers and not self._file_readers.is_builtin(extension):
+            # A third-party reader asked for this extension, its content is not second-guessed
+            return extension, self._file_readers[extension]
+
+        # The content decides when it disagrees with the extension, e.g. a CSV export saved as .xls.
+        # Text formats are hard to tell apart, between two of them the extension wins
+        detected = sniff_format(filepath)
+        if detected is not None and not (extension in _TEXT_FORMATS and detected in _TEXT_FORMATS):
+            if _FORMAT_ALIASES.get(detected, detected) != _FORMAT_ALIASES.get(extension, extension):
+                extension = detected
+        return extension, self._file_readers.get(extension)
+
+    def _expand_paths(self, filepath) -> Optional[List[str]]:
+        # A directory, a glob pattern or a list of paths means a multi-file import, a plain path does not
+        if type(filepath) is list:
+            return filepath
+        if os.path.isdir(filepath):
+            return sorted(entry.path for entry in os.scandir(filepath)
+                          if entry.is_file() and os.path.splitext(entry.name)[1].lower() in self._file_readers
+                          and not entry.name.lower().endswith('.toml'))
+        # An existing file whose name has glob characters, e.g. data[1].csv, is still a plain path
+        if not os.path.exists(filepath) and any(character in filepath for character in '*?['):
+            paths = sorted(glob.glob(filepath))
+            if not paths:
+                raise ValueError(f"No files match {filepath}")
+            return paths
+        return None
+
+    def _import_files(self, paths: List[str], cls, executor: str, chunk_size: int, cache,
+                      max_errors: Optional[int], fail_fast: bool, max_workers: Optional[int], columnar: bool = False):
+        readers = []
+        for path in paths:
+            file_extension, reader = self._reader_for(path)
+            if reader is None or file_extension == '.toml':
+                raise ValueError(f"Unsupported file format {file_extension} for {path}. "
+                                 f"Please upload a supported file type.")
+            readers.append(reader)
+
+        valid_data, errors = (RecordStore(cls) if columnar else []), ValidationErrors()
+        if not paths:
+            return valid_data, errors
+        # Files are read side by side, so the import takes about as long as the slowest one
+        with ThreadPoolExecutor(max_workers=min(len(paths), max_workers or (os.cpu_count() or 1) + 4)) as pool:
+            futures = [pool.submit(self._import_file, reader, path, cls, executor, chunk_size, cache, max_errors,
+                                   fail_fast, columnar)
+                       for reader, path in zip(readers, paths)]
+            # Results are merged in path order, each error keeps the file it came from
+            for path, future in zip(paths, futures):
+                file_valid, file_errors = future.result()
+                valid_data.extend(file_valid)
+                errors.extend(file_errors, source=path)
+        if max_errors is not None:
+            errors.truncate(max_errors)
+        return valid_data, errors
+
+    @staticmethod
+    def _import_sheets(reader: FileReader, filepath: str, cls, sheets, executor: str, max_errors: Optional[int],
+                       fail_fast: bool, max_workers: Optional[int], columnar: bool):
+        sheet_records = reader.read_sheets(filepath, sheets, Validator.model_columns(cls), Validator.model_dtypes(cls))
+        if not sheet_records:
+            return {}
+
+        # Validation holds the GIL, a thread per sheet would not run them side by side, so sheets are validated
+        # one after another and executor='process' is the way to spread a large sheet over several cores
+        results = {}
+        for name, (index, records) in sheet_records.items():
+            if executor == 'batch':
+                valid_data, errors = Validator.validate_records(records, cls, index, max_errors)
+            elif executor == 'process':
+                valid_data, errors = Validator.validate_inputs_process(pd.DataFrame.from_records(records, index=index),
+                                                                       cls, max_workers, max_errors)
+            else:
+                valid_data, errors = Validator.validate_inputs(pd.DataFrame.from_records(records, index=index), cls,
+                                                               executor, max_errors)
+            if fail_fast:
+                Validator.check_fail_fast(errors)
+            results[name] = (RecordStore(cls, valid_data) if columnar else valid_data), errors
+        return results
+
+    @staticmethod
+    def _error_lists(result):
+        # ValidationErrors in a wrapper result become plain lists of error dicts
+        if isinstance(result, ValidationErrors):
+            return result.to_list()
+        if isinstance(result, tuple):
+            return tuple(FileImporter._error_lists(item) for item in result)
+        if isinstance(result, dict):
+            return {name: FileImporter._error_lists(item) for name, item in result.items()}
+        if inspect.isgenerator(result):
+            return (FileImporter._error_lists(chunk) for chunk in result)
+        return result
+
+    @staticmethod
+    def _merge_sheets(results: Dict[str, tuple], cls, columnar: bool):
+        valid_data, errors = (RecordStore(cls) if columnar else []), ValidationErrors()
+        for name, (sheet_valid, sheet_errors) in results.items():
+            valid_data.extend(sheet_valid)
+            errors.extend(sheet_errors, sheet=name)
+        return valid_data, errors
 
     def __call__(self, cls):
-        def wrapper(filepath=None):
+        def import_data(filepath=None, executor='batch', stream=False, chunk_size=50_000, cache=None, max_errors=None,
+                    fail_fast=False, max_workers=None, incremental=False, columnar=False, sheet=None, sheets=None,
+                    merge_sheets=False):
+            # columnar=True returns the valid rows as a RecordStore of row views instead of a list of models
+            # sheet= imports one Excel sheet, sheets='*' or a list returns {sheet: (valid_data, errors)}
+            # or, with merge_sheets=True, one result whose errors name their sheet
+            # fail_fast raises ValueError on the first invalid row, max_errors stops after that many errors
+            if incremental and max_errors is not None:
+                raise ValueError("Incremental imports validate every changed row, max_errors is not supported")
+            if fail_fast:
+                max_errors = 1
 
-            if type(filepath) is str:
+            if filepath is None or type(filepath) is str:
                 filepath = filepath or self.file_path
                 if not filepath:
                     raise ValueError("Filepath is required for import_file")
 
-                file_extension = os.path.splitext(filepath)[1].lower()
-                reader = self._file_readers.get(file_extension)
+            paths = None
+            if type(filepath) is str or (type(filepath) is list and filepath
+                                         and all(type(path) is str for path in filepath)):
+                paths = self._expand_paths(filepath)
+            if paths is not None:
+                if stream or incremental or sheet is not None or sheets is not None:
+                    raise ValueError("stream, incremental and sheet imports read a single file, "
+                                     "import several files without them")
+                # cache=None uses the decorator's cache, True/False/ImportCache override it per call
+                cache = self.cache if cache is None else self._resolve_cache(cache)
+                if max_errors is not None:
+                    cache = None
+                return self._import_files(paths, cls, executor, chunk_size, cache, max_errors, fail_fast,
+                                          max_workers, columnar)
+
+            if type(filepath) is str:
+
+                file_extension, reader = self._reader_for(filepath)
                 print(reader)
 
                 if reader is None:
                     raise ValueError(f"Unsupported file format {file_extension}. Please upload a supported file type.")
 
-                if file_extension == '.toml':
+                if sheet is not None or sheets is not None:
+                    if not hasattr(reader, 'read_sheets'):
+                        raise ValueError(f"Sheet selection needs an Excel file, got {file_extension}")
+                    if stream or incremental:
+                        raise ValueError("Sheet imports cannot be combined with stream or incremental")
+                    results = self._import_sheets(reader, filepath, cls, sheet if sheets is None else sheets, executor,
+                                                  max_errors, fail_fast, max_workers, columnar)
+                    if sheets is None and not isinstance(sheet, (list, tuple)):
+                        return next(iter(results.values()))
+                    return self._merge_sheets(results, cls, columnar) if merge_sheets else results
+                elif file_extension == '.toml':
                     # For TOML, load the entire content and convert it to the Pydantic model
                     toml_data = reader.read(filepath)
                     return cls(**toml_data)  # Directly convert the TOML data to the Pydantic model
+                elif incremental:
+                    # Returns (valid_data, errors, diff), diff lists the added, changed and removed keys
+                    index = RowIndex() if incremental is True else incremental
+                    chunks = reader.iter_records(filepath, chunk_size, Validator.model_columns(cls),
+                                                 Validator.model_dtypes(cls))
+                    valid_data, errors, diff = index.update(filepath, chunks, cls, fail_fast)
+                    return (RecordStore(cls, valid_data) if columnar else valid_data), errors, diff
+                elif stream:
+                    # Generator of (valid_data, errors) per chunk, peak memory follows chunk_size
+                    return self._stream(reader, filepath, cls, chunk_size, max_errors, fail_fast, columnar)
                 else:
-                    # For other formats, assume they return a DataFrame
-                    df = reader.read(filepath)
-                    df = df.replace(np.nan, None)
-                    valid_data, errors = Validator.validate_inputs_parallel(df, cls)
-                    return valid_data, errors
+                    # cache=None uses the decorator's cache, True/False/ImportCache override it per call
+                    cache = self.cache if cache is None else self._resolve_cache(cache)
+                    # A budgeted run stops early, its partial result must not be served as the full import
+                    if max_errors is not None:
+                        cache = None
+                    return self._import_file(reader, filepath, cls, executor, chunk_size, cache, max_errors,
+                                             fail_fast, columnar)
 
             elif type(filepath) is pd.DataFrame:
                 df = filepath
-                df = df.replace(np.nan, None)
-                valid_data, errors = Validator.validate_inputs_parallel(df, cls)
-                return valid_data, errors
+                df = _nan_to_none(df)
+                valid_data, errors = Validator.validate_inputs(df, cls, executor, max_errors)
+                if fail_fast:
+                    Validator.check_fail_fast(errors)
+                return (RecordStore(cls, valid_data) if columnar else valid_data), errors
+
+            elif type(filepath) is list and executor == 'batch' and all(type(row) is dict for row in filepath):
+                # Records are validated as they are, without building and unpacking a DataFrame
+                valid_data, errors = Validator.validate_records(_clean_records(filepath), cls, max_errors=max_errors)
+                if fail_fast:
+                    Validator.check_fail_fast(errors)
+                return (RecordStore(cls, valid_data) if columnar else valid_data), errors
+
+            elif type(filepath) is dict and executor == 'batch' and (records := _column_records(filepath)) is not None:
+                valid_data, errors = Validator.validate_records(_clean_records(records), cls, max_errors=max_errors)
+                if fail_fast:
+                    Validator.check_fail_fast(errors)
+                return (RecordStore(cls, valid_data) if columnar else valid_data), errors
 
             elif type(filepath) is list:
                 df = pd.DataFrame.from_records(filepath)
-                df = df.replace(np.nan, None)
-                valid_data, errors = Validator.validate_inputs_parallel(df, cls)
-                return valid_data, errors
+                df = _nan_to_none(df)
+                valid_data, errors = Validator.validate_inputs(df, cls, executor, max_errors)
+                if fail_fast:
+                    Validator.check_fail_fast(errors)
+                return (RecordStore(cls, valid_data) if columnar else valid_data), errors
 
             elif type(filepath) is dict:
                 df = pd.DataFrame.from_dict(filepath)
-                df = df.replace(np.nan, None)
-                valid_data, errors = Validator.validate_inputs_parallel(df, cls)
-                return valid_data, errors
+                df = _nan_to_none(df)
+                valid_data, errors = Validator.validate_inputs(df, cls, executor, max_errors)
+                if fail_fast:
+                    Validator.check_fail_fast(errors)
+                return (RecordStore(cls, valid_data) if columnar else valid_data), errors
 
             else:
                 print("Invalid Input File")
 
+        def wrapper(filepath=None, *args, compact_errors=False, **kwargs):
+            # Errors are a list of dicts, compact_errors=True returns them as ValidationErrors parallel arrays,
+            # which need far less memory for a file with millions of errors
+            result = import_data(filepath, *args, **kwargs)
+            return result if compact_errors else self._error_lists(result)
+
+        async def aimport(filepath=None, **kwargs):
+            # Same arguments and result as the wrapper, reading and validation run off the event loop
+            return await asyncio.to_thread(wrapper, filepath, **kwargs)
+
+        async def astream(filepath=None, chunk_size=50_000, **kwargs):
+            # Async generator of (valid_data, errors) per chunk, each chunk is yielded as soon as it is validated
+            chunks = await asyncio.to_thread(wrapper, filepath, stream=True, chunk_size=chunk_size, **kwargs)
+            async for chunk in _aiterate(chunks):
+                yield chunk
+
+        wrapper.model = cls
+        wrapper.cache = self.cache
+        wrapper.aimport = aimport
+        wrapper.astream = astream
         # Return a callable that automatically uses the wrapper
         return wrapper
@@ -1,15 +1,159 @@
+import asyncio
+import hashlib
+import json
 import os
+import pickle
+import threading
 import toml
-from typing import List, Type, TypeVar, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from types import MappingProxyType
+from typing import AsyncIterator, Callable, Iterable, List, Mapping, NamedTuple, Type, TypeVar, Dict, Optional, \
+    Tuple, Union
 
-from Utilities.Data_Structures import SubscriptionConfig, SiteUpdateStatus, DataFileImport
-from Utilities.File_IO import FileImporter
+from Utilities.Data_Structures import SubscriptionConfig, LazySubscriptionConfig, SiteUpdateStatus, DataFileImport
+from Utilities.File_IO import FileImporter, load_toml
 from pydantic import BaseModel
 
 # Define your Pydantic models here (as you provided)
 T = TypeVar('T', bound=BaseModel)
 
 
+class ConfigState(NamedTuple):
+    """One published set of configs, replaced as a whole on every reload."""
+    config_objects: Tuple[SubscriptionConfig, ...]
+    configs: Mapping[str, SubscriptionConfig]
+
+
+class ConfigSnapshot:
+    """Validated configs pickled into one file, each with the mtime, size and hash of its SiteConfig file."""
+
+    def __init__(self, path: Optional[str] = None):
+        # The snapshot is unpickled as is, it must only ever be written by this process' own user.
+        # Without a path each model gets its own file, so eager and lazy loaders do not wipe each other's
+        self.path = path
+        self._entries = None
+        self._schema = None
+        self._dirty = False
+
+    @staticmethod
+    def default_path(model: Type[BaseModel]) -> str:
+        return os.path.join('.cache', f"site_configs.{model.__name__}.snapshot")
+
+    @staticmethod
+    def schema_hash(model: Type[BaseModel]) -> str:
+        schema = json.dumps(model.model_json_schema(), sort_keys=True, default=str)
+        return hashlib.sha1(schema.encode()).hexdigest()
+
+    @staticmethod
+    def source_path(name: str) -> str:
+        return os.path.abspath(os.path.join("SiteConfig", f"{name}.toml"))
+
+    @staticmethod
+    def fingerprint(path: str) -> Optional[Tuple[int, int, str]]:
+        try:
+            stat = os.stat(path)
+            with open(path, 'rb') as f:
+                digest = hashlib.sha1(f.read()).hexdigest()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, digest
+
+    def _load(self, model: Type[BaseModel]) -> Dict[str, dict]:
+        if self.path is None:
+            self.path = self.default_path(model)
+        if self._schema is None:
+            self._schema = self.schema_hash(model)
+        if self._entries is not None:
+            return self._entries
+        try:
+            with open(self.path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            snapshot = {}
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            snapshot = {}
+        # A changed model invalidates every entry, they were validated against the old one
+        self._entries = snapshot.get('entries', {}) if snapshot.get('schema') == self._schema else {}
+        return self._entries
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            pickle.dump({'schema': self._schema, 'entries': self._entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        self._entries = {}
+        self._dirty = True
+        if self.path is None:
+            return
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def save(self, names: Iterable[str]):
+        # Called once per load with every subscription of the input file, entries of removed ones are dropped
+        if self._entries is None:
+            return
+        names = set(names)
+        removed = [name for name in self._entries if name not in names]
+        for name in removed:
+            del self._entries[name]
+        if self._dirty or removed:
+            self._save()
+            self._dirty = False
+
+    @classmethod
+    def _is_fresh(cls, entry: dict, statuses: Tuple) -> bool:
+        if entry['statuses'] != statuses:
+            return False
+        try:
+            stat = os.stat(entry['source'])
+        except FileNotFoundError:
+            return False
+        mtime_ns, size, digest = entry['fingerprint']
+        if (stat.st_mtime_ns, stat.st_size) == (mtime_ns, size):
+            return True
+        # A file that was saved again without changes keeps its entry
+        fingerprint = cls.fingerprint(entry['source'])
+        if fingerprint is not None and fingerprint[1:] == (size, digest):
+            entry['fingerprint'] = fingerprint
+            return True
+        return False
+
+    def build(self, rows: List[BaseModel], model: Type[T], process: Callable[[List[BaseModel]], List[T]],
+              envs: Optional[Tuple[str, ...]] = None) -> List[T]:
+        entries = self._load(model)
+        configs, stale_rows, fingerprints = {}, [], {}
+        for row in rows:
+            entry = entries.get(row.name)
+            if entry is not None and self._is_fresh(entry, (row.prod, row.stage, row.dev, envs)):
+                configs[row.name] = entry['config']
+            else:
+                stale_rows.append(row)
+                # Taken before parsing, so a file edited meanwhile is seen as stale next time
+                fingerprints[row.name] = self.fingerprint(self.source_path(row.name))
+
+        # Only new rows, changed rows and edited SiteConfig files are parsed and validated again
+        if stale_rows:
+            statuses = {row.name: (row.prod, row.stage, row.dev, envs) for row in stale_rows}
+            for config in process(stale_rows):
+                source = self.source_path(config.name)
+                entries[config.name] = {
+                    'source': source,
+                    'fingerprint': fingerprints.get(config.name) or self.fingerprint(source),
+                    'statuses': statuses[config.name],
+                    'config': config,
+                }
+                configs[config.name] = config
+            # Written by save() once the whole input file is loaded, not once per chunk
+            self._dirty = True
+        return [configs[row.name] for row in rows if row.name in configs]
+
+
 class ConfigLoader:
     update_status_mapping = {
         0: SiteUpdateStatus.PRE_UPDATE,
@@ -17,9 +161,32 @@ class ConfigLoader:
         2: SiteUpdateStatus.POST_UPDATED,
     }
 
-    def __init__(self, file_path: str = None):
+    def __init__(self, file_path: str = None, chunk_size: int = None, incremental: bool = False,
+                 max_workers: int = None, executor: str = 'thread',
+                 snapshot: Union[bool, str, ConfigSnapshot] = True, lazy_envs: bool = False,
+                 envs: Optional[List[str]] = None):
         self.file_path = file_path
-        self.config_objects = self._load_config_objects()
+        self.chunk_size = chunk_size
+        self.incremental = incremental
+        self.max_workers = max_workers
+        self.executor = executor
+        self.missing_configs = []  # FileNotFoundError per subscription without a SiteConfig file
+        # lazy_envs validates each env section on first access, envs drops every other section up front
+        self.model = LazySubscriptionConfig if lazy_envs else SubscriptionConfig
+        self.envs = tuple(envs) if envs is not None else None
+        # Validated configs are reused from the snapshot file while their rows and SiteConfig files are unchanged
+        if snapshot is True:
+            snapshot = ConfigSnapshot()
+        elif isinstance(snapshot, str):
+            snapshot = ConfigSnapshot(snapshot)
+        self.snapshot = snapshot or None
+        self.rows = []  # Imported rows the configs were built from, in input file order
+        self._lock = threading.RLock()
+        self._watcher = None
+        self._stop_watching = threading.Event()
+        # Taken before loading, so a file edited while the configs are built is picked up by the next poll
+        self._stats = self._watched_stats()
+        self._publish(self._load_config_objects())
         self.loaded_configs = {}  # To store loaded TOML configurations
 
     def __iter__(self):
@@ -32,9 +199,169 @@ class ConfigLoader:
         return f'ConfigLoader(file_path={self.file_path}, config_objects={self.config_objects})'
 
     def _load_config_objects(self) -> List[SubscriptionConfig]:
+        if self.chunk_size:
+            # Build configs chunk by chunk while the rest of the input file is still being read
+            config_objects = []
+            for valid_rows, _ in DataFileImport(self.file_path, stream=True, chunk_size=self.chunk_size):
+                self.rows.extend(valid_rows)
+                config_objects.extend(self._process(valid_rows))
+            return config_objects
+
+        if self.incremental:
+            # Fills the shared row index, so refresh() does not validate unchanged rows again
+            imported_data = DataFileImport(self.file_path, incremental=True)[0]
+            self.rows = list(imported_data)
+            return self._process(imported_data)
+
         imported_data = DataFileImport(self.file_path)[0]  # Assumes DataFileImport returns [0] for the rows
         print("imported_data---------->>", imported_data)
-        return self.process_imported_data(imported_data, SubscriptionConfig)
+        self.rows = list(imported_data)
+        return self._process(imported_data)
+
+    @property
+    def config_objects(self) -> Tuple[SubscriptionConfig, ...]:
+        return self.state.config_objects
+
+    @property
+    def configs(self) -> Mapping[str, SubscriptionConfig]:
+        return self.state.configs
+
+    def _publish(self, config_objects: List[SubscriptionConfig]):
+        # One immutable state is swapped in with a single assignment, readers never block and never see the
+        # list and the map of two different reloads. Read `state` once to use both together
+        self.state = ConfigState(tuple(config_objects),
+                                 MappingProxyType({config.name: config for config in config_objects}))
+        if self.snapshot is not None:
+            self.snapshot.save(row.name for row in self.rows)
+
+    def _process(self, rows: List[BaseModel]) -> List[SubscriptionConfig]:
+        def process(stale_rows: List[BaseModel]) -> List[SubscriptionConfig]:
+            return self.process_imported_data(stale_rows, self.model, self.max_workers, self.executor,
+                                              self.missing_configs, self.envs)
+
+        if self.snapshot is None:
+            return process(rows)
+        return self.snapshot.build(rows, self.model, process, self.envs)
+
+    @classmethod
+    def compile_snapshot(cls, file_path: str = None, snapshot_path: str = None, **kwargs) -> 'ConfigLoader':
+        # Validates every config from scratch and writes a fresh snapshot for later startups
+        snapshot = ConfigSnapshot(snapshot_path) if snapshot_path else ConfigSnapshot()
+        snapshot.clear()
+        return cls(file_path, snapshot=snapshot, **kwargs)
+
+    @staticmethod
+    def _rows_by_name(rows: List[BaseModel]) -> Dict[str, List[BaseModel]]:
+        grouped = {}
+        for row in rows:
+            grouped.setdefault(row.name, []).append(row)
+        return grouped
+
+    def refresh(self) -> Dict[str, List]:
+        # Re-imports the input file and rebuilds only the subscriptions whose rows were added or changed.
+        # The row index on disk is shared with every other loader and import, it only saves validating
+        # unchanged rows again, the diff is taken against the rows this loader built its configs from
+        with self._lock:
+            imported_data = DataFileImport(self.file_path, incremental=True)[0]
+            previous, current_rows = self._rows_by_name(self.rows), self._rows_by_name(imported_data)
+            diff = {
+                'added': [name for name in current_rows if name not in previous],
+                'changed': [name for name, rows in current_rows.items()
+                            if name in previous and rows != previous[name]],
+                'removed': [name for name in previous if name not in current_rows],
+            }
+            stale = set(diff['added']) | set(diff['changed'])
+            rebuilt = {config.name: config
+                       for config in self._process([row for row in imported_data if row.name in stale])}
+            current = self.configs
+
+            # Rows keep the input file order, removed rows simply have no config any more
+            self.rows = list(imported_data)
+            self._publish([config for config in
+                           (rebuilt.get(row.name) if row.name in stale else current.get(row.name)
+                            for row in imported_data)
+                           if config is not None])
+            return diff
+
+    def _watched_stats(self) -> Dict[str, Tuple[int, int]]:
+        stats = {}
+        if os.path.isdir("SiteConfig"):
+            for entry in os.scandir("SiteConfig"):
+                if entry.name.endswith('.toml'):
+                    stat = entry.stat()
+                    stats[entry.name[:-len('.toml')]] = (stat.st_mtime_ns, stat.st_size)
+        if self.file_path and os.path.exists(self.file_path):
+            stat = os.stat(self.file_path)
+            stats[None] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def poll(self) -> List[str]:
+        # One scan of SiteConfig/ and the input file, only the subscriptions whose files changed are rebuilt
+        with self._lock:
+            stats = self._watched_stats()
+            changed = {name for name in stats.keys() | self._stats.keys() if stats.get(name) != self._stats.get(name)}
+            if not changed:
+                return []
+
+            refreshed, removed = set(), set()
+            if None in changed:
+                # The input file changed, rows are re-imported and only added or changed ones rebuilt
+                diff = self.refresh()
+                changed.discard(None)
+                refreshed.update(diff['added'], diff['changed'])
+                removed.update(diff['removed'])
+
+            rows = {row.name: row for row in self.rows}
+            stale = [rows[name] for name in changed if name in rows and name not in refreshed]
+            if stale:
+                rebuilt = {config.name: config for config in self._process(stale)}
+                current = dict(self.configs)
+                current.update(rebuilt)
+                self._publish([current[row.name] for row in self.rows if row.name in current])
+            # Stats only move on once the rebuild worked, a half-written file is retried on the next poll
+            self._stats = stats
+            # Files of subscriptions the input file does not list are not reported
+            return sorted({name for name in changed if name in rows} | refreshed | removed)
+
+    def watch(self, interval: float = 1.0,
+              on_change: Callable[[List[str]], None] = None) -> threading.Thread:
+        # Polls in a daemon thread and publishes a new config map after every change
+        if self._watcher is not None and self._watcher.is_alive():
+            return self._watcher
+        self._stop_watching.clear()
+
+        def run():
+            while not self._stop_watching.wait(interval):
+                try:
+                    changed = self.poll()
+                except Exception as e:
+                    print(f"Config reload failed: {e}")
+                    continue
+                if changed and on_change is not None:
+                    on_change(changed)
+
+        self._watcher = threading.Thread(target=run, name='ConfigLoader.watch', daemon=True)
+        self._watcher.start()
+        return self._watcher
+
+    def stop(self):
+        self._stop_watching.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+
+    @classmethod
+    async def aload(cls, file_path: str = None, chunk_size: int = None, **kwargs) -> 'ConfigLoader':
+        # Builds the loader in a worker thread so the Playwright event loop keeps running
+        return await asyncio.to_thread(cls, file_path, chunk_size, **kwargs)
+
+    @staticmethod
+    async def aiter_configs(file_path: str = None, chunk_size: int = 1_000) -> AsyncIterator[SubscriptionConfig]:
+        # Yields configs chunk by chunk as soon as their rows are imported, without building a ConfigLoader
+        async for valid_rows, _ in DataFileImport.astream(file_path, chunk_size=chunk_size):
+            configs = await asyncio.to_thread(ConfigLoader.process_imported_data, valid_rows, SubscriptionConfig)
+            for config in configs:
+                yield config
 
     @staticmethod
     def dict_to_pydantic(model: Type[T], data: Dict) -> T:
@@ -63,16 +390,14 @@ class ConfigLoader:
                 raise FileNotFoundError(f"Sample configuration file not found at {sample_file_path}")
 
             # Load data from sample.toml
-            with open(sample_file_path, 'r') as sample_file:
-                sample_data = toml.load(sample_file)
+            sample_data = load_toml(sample_file_path)
 
             # Write the sample data to the new file
             with open(file_path, 'w') as new_file:
                 toml.dump(sample_data, new_file)
 
-        # Load and return the data from the specified file
-        with open(file_path, 'r') as file:
-            config_data = toml.load(file)
+        # Load and return the data from the specified file, parsed once per process until it changes
+        config_data = load_toml(file_path)
 
         subscription_data = config_data.get('subscription', {})
         subscription_data['name'] = name  # Ensure the name is included
@@ -80,39 +405,62 @@ class ConfigLoader:
         return subscription_data
 
     @staticmethod
-    def process_imported_data(successful_rows: List[BaseModel], model: Type[T]) -> List[T]:
+    def _build_config(name: str, statuses: Dict[str, Optional[int]], model: Type[T],
+                      envs: Optional[Tuple[str, ...]] = None) -> T:
+        subscription_data = ConfigLoader.load_toml_config_as_object(name)
+
+        # Add update_status to the appropriate env based on the row data
+        env_config = subscription_data.get('env', {})
+        if envs is not None:
+            # Sections the run does not target are never validated
+            env_config = {env: section for env, section in env_config.items() if env in envs}
+        for env in ('prod', 'stage', 'dev'):
+            if env in env_config:
+                if statuses[env] is not None:
+                    env_config[env]['update_status'] = ConfigLoader.update_status_mapping.get(statuses[env])
+                if env_config[env].get('update_status') is None:
+                    env_config.pop(env)
+
+        subscription_data['env'] = env_config
+        return ConfigLoader.dict_to_pydantic(model, subscription_data)
+
+    @staticmethod
+    def _try_build_config(name: str, statuses: Dict[str, Optional[int]], model: Type[T],
+                          envs: Optional[Tuple[str, ...]] = None) -> Tuple[Optional[T], Optional[FileNotFoundError]]:
+        try:
+            return ConfigLoader._build_config(name, statuses, model, envs), None
+        except FileNotFoundError as e:
+            return None, e
+
+    @staticmethod
+    def process_imported_data(successful_rows: List[BaseModel], model: Type[T], max_workers: int = None,
+                              executor: str = 'thread', missing: List[FileNotFoundError] = None,
+                              envs: Optional[Tuple[str, ...]] = None) -> List[T]:
+        # max_workers builds configs in a thread or process pool, results keep the order of the rows.
+        # Missing config files go into `missing` when it is given, otherwise they are printed
+        names = [row.name for row in successful_rows]
+        # Rows are passed as plain values, decorated import models cannot be pickled to a process
+        statuses = [{'prod': row.prod, 'stage': row.stage, 'dev': row.dev} for row in successful_rows]
+
+        if max_workers is None or len(names) < 2:
+            results = map(ConfigLoader._try_build_config, names, statuses, repeat(model), repeat(envs))
+        else:
+            if executor not in ('thread', 'process'):
+                raise ValueError(f"Unknown executor '{executor}', expected 'thread' or 'process'")
+            pool_class = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+            chunksize = max(1, len(names) // (max_workers * 4))
+            with pool_class(max_workers=max_workers) as pool:
+                results = list(pool.map(ConfigLoader._try_build_config, names, statuses, repeat(model),
+                                        repeat(envs), chunksize=chunksize))
+
         config_objects = []
-        for row in successful_rows:
-            try:
-                subscription_data = ConfigLoader.load_toml_config_as_object(row.name)
-
-                # Add update_status to the appropriate env based on the row data
-                env_config = subscription_data.get('env', {})
-
-                if 'prod' in env_config:
-                    if row.prod is not None:
-                        env_config['prod']['update_status'] = ConfigLoader.update_status_mapping.get(row.prod)
-                    if env_config['prod'].get('update_status') is None:
-                        env_config.pop('prod')
-
-                if 'stage' in env_config:
-                    if row.stage is not None:
-                        env_config['stage']['update_status'] = ConfigLoader.update_status_mapping.get(row.stage)
-                    if env_config['stage'].get('update_status') is None:
-                        env_config.pop('stage')
-
-                if 'dev' in env_config:
-                    if row.dev is not None:
-                        env_config['dev']['update_status'] = ConfigLoader.update_status_mapping.get(row.dev)
-                    if env_config['dev'].get('update_status') is None:
-                        env_config.pop('dev')
-
-                subscription_data['env'] = env_config
-
-                config = ConfigLoader.dict_to_pydantic(model, subscription_data)
+        for config, error in results:
+            if error is None:
                 config_objects.append(config)
-            except FileNotFoundError as e:
-                print(e)
+            elif missing is None:
+                print(error)
+            else:
+                missing.append(error)
         return config_objects
 
 # #  name='ultimateqa'
@@ -0,0 +1,294 @@
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel, Field, model_validator
+
+from Utilities import FileHandel, file_importer
+from Utilities.Data_Structures import TestResult, TestStatus
+from Utilities.File_IO import ExcelFileReader, FileImporter, Validator
+
+try:
+    import resource
+except ImportError:  # Windows has no resource module, peak RSS is reported as None there
+    resource = None
+
+
+class BenchmarkRow(BaseModel):
+    name: str
+    prod: Optional[int] = None
+    dev: Optional[int] = None
+    stage: Optional[int] = None
+
+
+@FileImporter()
+class ImporterRow(BaseModel):
+    # Same fields and validator as DataFileImport in FileHandel and file_importer, so all three do the same work
+    to_test: int = Field(ge=0, le=1)
+    name: str
+    pre_update_url: Optional[str] = None
+    development_url: Optional[str] = None
+    post_update_url: Optional[str] = None
+    registration: Optional[str] = None
+    login: Optional[str] = None
+    password: Optional[str] = None
+    video_page: Optional[str] = None
+    new_test: int = Field(ge=0, le=1)
+
+    @model_validator(mode="before")
+    @classmethod
+    def check_at_least_one_url(cls, values):
+        if not any([values.get('pre_update_url'), values.get('development_url'), values.get('post_update_url')]):
+            raise ValueError('At least one of pre_update_url, development_url, or post_update_url must be provided.')
+        return values
+
+
+def make_frame(rows: int, error_rate: float = 0.01, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'name': [f"subscription_{i}" for i in range(rows)],
+        'prod': rng.integers(0, 3, rows),
+        'dev': rng.integers(0, 3, rows),
+        'stage': rng.integers(0, 3, rows),
+    }).astype(object)
+    bad_rows = rng.random(rows) < error_rate
+    df.loc[bad_rows, 'prod'] = 'not-a-number'
+    return df.replace(np.nan, None)
+
+
+def make_importer_frame(rows: int, error_rate: float = 0.01, seed: int = 0) -> pd.DataFrame:
+    # Columns of the DataFileImport example models in FileHandel and file_importer
+    rng = np.random.default_rng(seed)
+    url = np.array([f"https://example.com/{i}" for i in range(rows)], dtype=object)
+    df = pd.DataFrame({
+        'to_test': rng.integers(0, 2, rows),
+        'name': [f"subscription_{i}" for i in range(rows)],
+        'pre_update_url': url,
+        'development_url': url,
+        'post_update_url': url,
+        'registration': '',
+        'login': '',
+        'password': '',
+        'video_page': '',
+        'new_test': rng.integers(0, 2, rows),
+    })
+    df.loc[rng.random(rows) < error_rate, 'new_test'] = 5
+    return df
+
+
+def write_input(df: pd.DataFrame, path: str):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        df.to_csv(path, index=False)
+    elif extension == '.xlsx':
+        df.to_excel(path, index=False)
+    elif extension == '.json':
+        df.to_json(path, orient='records')
+    else:
+        raise ValueError(f"Unsupported benchmark format {extension}")
+
+
+def _peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _counts(result) -> Tuple[int, int]:
+    valid_data, errors = result[0], result[1]
+    return len(valid_data), len(errors)
+
+
+def _read_only(reader, path: str) -> Tuple[int, int]:
+    if reader.native_records:
+        return sum(len(records) for _, records in reader.iter_records(path, 50_000)), 0
+    return len(reader.read(path)), 0
+
+
+def import_targets(extension: str) -> Dict[str, Callable[[str], Tuple[int, int]]]:
+    # Full imports through each implementation, plus a plain read through every File_IO reader for the format
+    targets = {
+        'File_IO': lambda path: _counts(ImporterRow(path)),
+        'FileHandel': lambda path: _counts(FileHandel.DataFileImport.import_file(filepath=path)),
+        'file_importer': lambda path: _counts(file_importer.DataFileImport(filepath=path)),
+    }
+    readers = [FileImporter._file_readers[extension]]
+    if extension == '.xlsx':
+        readers.append(ExcelFileReader())
+    for reader in readers:
+        targets[f"File_IO.{type(reader).__name__}"] = lambda path, reader=reader: _read_only(reader, path)
+    return targets
+
+
+def _measure(target: str, path: str, repeat: int) -> dict:
+    # Runs in a fresh process so the peak RSS belongs to this target alone
+    run = import_targets(os.path.splitext(path)[1].lower())[target]
+    baseline_rss = _peak_rss_mb()
+    seconds, counts = float('inf'), (0, 0)
+    for _ in range(repeat):
+        start = time.perf_counter()
+        counts = run(path)
+        seconds = min(seconds, time.perf_counter() - start)
+    return {'seconds': seconds, 'valid': counts[0], 'errors': counts[1], 'baseline_rss_mb': baseline_rss,
+            'peak_rss_mb': _peak_rss_mb()}
+
+
+def bench_import_suite(rows: List[int], error_rates: List[float], formats: List[str], targets: List[str] = None,
+                       repeat: int = 1, data_dir: Optional[str] = None, output: Optional[str] = None) -> List[dict]:
+    results = []
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as temp_dir:
+        data_dir = data_dir or temp_dir
+        os.makedirs(data_dir, exist_ok=True)
+        for row_count in rows:
+            for error_rate in error_rates:
+                df = make_importer_frame(row_count, error_rate)
+                for extension in formats:
+                    path = os.path.join(data_dir, f"bench_{row_count}_{error_rate}{extension}")
+                    if not os.path.exists(path):
+                        write_input(df, path)
+                    for target in import_targets(extension):
+                        if targets and target not in targets:
+                            continue
+                        result = {'target': target, 'format': extension.lstrip('.'), 'rows': row_count,
+                                  'error_rate': error_rate, 'repeat': repeat}
+                        try:
+                            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                                result.update(pool.submit(_measure, target, path, repeat).result())
+                            result['rows_per_sec'] = row_count / result['seconds'] if result['seconds'] else None
+                            print(f"{target:>34} {extension:>6} {row_count:>9} rows: {result['seconds']:8.3f}s "
+                                  f"{result['rows_per_sec']:12,.0f} rows/sec, peak RSS {result['peak_rss_mb'] or 0:8.1f} MB")
+                        except Exception as e:
+                            # One failing implementation should not lose the rest of the run
+                            result['error'] = f"{type(e).__name__}: {e}"
+                            print(f"{target:>34} {extension:>6} {row_count:>9} rows: failed, {result['error']}")
+                        results.append(result)
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump({
+                'created': datetime.now(timezone.utc).isoformat(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'pandas': pd.__version__,
+                'results': results,
+            }, f, indent=2)
+    return results
+
+
+def bench_repeated_imports(rows: int = 100, imports: int = 50):
+    # Small files imported many times, where building the pydantic model used to dominate
+    importers = {
+        'FileHandel': (FileHandel.FileImporter,
+                       lambda path: FileHandel.DataFileImport.import_file(filepath=path)),
+        'file_importer': (file_importer.FileImporter,
+                          lambda path: file_importer.DataFileImport(filepath=path)),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'repeated.csv')
+        make_importer_frame(rows).to_csv(path, index=False)
+
+        for name, (importer, run_import) in importers.items():
+            def recompiled():
+                importer._compiled_models.clear()
+                run_import(path)
+
+            before = timeit.timeit(recompiled, number=imports) / imports
+            run_import(path)
+            after = timeit.timeit(lambda: run_import(path), number=imports) / imports
+            print(f"{name:>14}: {before * 1000:8.2f} ms per import recompiling, "
+                  f"{after * 1000:8.2f} ms with the compiled model ({before / after:.1f}x)")
+
+
+def load_results(path: str) -> List[TestResult]:
+    with open(path, 'r') as f:
+        return [TestResult.model_validate(result) for result in json.load(f)]
+
+
+def bench_result_loading(rows: int = 100_000, repeat: int = 3):
+    # Results files read back the way OutputHandler writes them, plus model_validate against model_construct on
+    # parsed data.
+    # model_construct does its field handling in Python and is not faster than validating in pydantic-core,
+    # which is why results are loaded with full validation
+    statuses = list(TestStatus)
+    results = [{'Name': f"test_{i}", 'Status': statuses[i % len(statuses)].value, 'Description': f"check {i}",
+                'Actual_Result': {'status_code': 200, 'elements': i % 7}, 'Proof_Path': [f"proof/{i}.png"]}
+               for i in range(rows)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.json')
+        with open(path, 'w') as f:
+            json.dump(results, f)
+        seconds = min(timeit.repeat(lambda: load_results(path), number=1, repeat=repeat))
+        print(f"{rows:>8} TestResult from JSON: {seconds * 1000:8.1f} ms, {rows / seconds:12,.0f} results/sec")
+
+    validate = min(timeit.repeat(lambda: [TestResult.model_validate(result) for result in results], number=1,
+                                 repeat=repeat))
+    construct = min(timeit.repeat(lambda: [TestResult.model_construct(**result) for result in results], number=1,
+                                  repeat=repeat))
+    print(f"{rows:>8} TestResult parsed: {validate * 1000:8.1f} ms model_validate, "
+          f"{construct * 1000:8.1f} ms model_construct")
+
+
+def bench_validation(rows: int, error_rate: float, repeat: int = 3, executors=('thread', 'batch', 'process')):
+    df = make_frame(rows, error_rate)
+    results = {}
+    for executor in executors:
+        seconds = min(timeit.repeat(lambda: Validator.validate_inputs(df, BenchmarkRow, executor),
+                                    number=1, repeat=repeat))
+        results[executor] = seconds
+        print(f"{executor:>8}: {rows:>8} rows in {seconds:8.3f}s -> {rows / seconds:12,.0f} rows/sec")
+    if 'thread' in results:
+        for executor, seconds in results.items():
+            if executor != 'thread':
+                print(f"   {executor} speedup over thread: {results['thread'] / seconds:.1f}x")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare File_IO validation executors and the file importers.")
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--error-rate', type=float, nargs='+', default=[0.01])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--executors', nargs='+', default=['thread', 'batch', 'process'])
+    parser.add_argument('--repeated-imports', type=int, default=50,
+                        help="Imports of a small file used to time model compilation, 0 to skip.")
+    parser.add_argument('--load-results', type=int, default=100_000,
+                        help="Results loaded back from a results file, 0 to skip.")
+    parser.add_argument('--suite', action='store_true',
+                        help="Import generated files through every importer and reader instead of timing executors.")
+    parser.add_argument('--formats', nargs='+', default=['.csv', '.xlsx', '.json'])
+    parser.add_argument('--targets', nargs='+', help="Only run these importers or readers, e.g. File_IO FileHandel.")
+    parser.add_argument('--data-dir', help="Keep generated input files here and reuse them between runs.")
+    parser.add_argument('--output', help="Write the suite results as JSON to this file.")
+    args = parser.parse_args()
+
+    if args.suite:
+        bench_import_suite(args.rows, args.error_rate, args.formats, args.targets, args.repeat, args.data_dir,
+                           args.output)
+        return
+
+    for rows in args.rows:
+        for error_rate in args.error_rate:
+            bench_validation(rows, error_rate, args.repeat, args.executors)
+    if args.repeated_imports:
+        bench_repeated_imports(imports=args.repeated_imports)
+    if args.load_results:
+        bench_result_loading(args.load_results, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
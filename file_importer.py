@@ -2,11 +2,123 @@ import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ValidationError, Field, model_validator
 from typing import List, Optional, Any, Hashable
+from collections import OrderedDict
 import timeit
 import os
 import json
 
 
+class LazyRecords:
+    """
+    Iterable of file rows that are validated on first access.
+
+    The file is read up front, but each row is only turned into a model instance when it is
+    fetched with ``row()`` or reached during iteration. Validated rows are kept in an LRU cache,
+    optionally bounded by ``cache_size``.
+
+    Args:
+        df (pd.DataFrame): Rows read from the file, with validated headers.
+        model (type): Pydantic model used to validate each row.
+        cache_size (int, optional): Maximum number of validated rows to keep. Unbounded if None.
+
+    Notes:
+        This is not a sequence: iteration skips invalid rows, so it behaves like the eager list of
+        valid rows, while ``row()`` takes a position in the file and raises ``ValueError`` for a row
+        that fails validation. ``row_count`` counts every row in the file. Errors of every row
+        validated so far are collected in ``errors``.
+    """
+
+    _iteration_block = 1000
+
+    def __init__(self, df: pd.DataFrame, model, cache_size: Optional[int] = None):
+        self._df = df
+        self._model = model
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        self._failed = {}
+        self.errors = []
+
+    @property
+    def row_count(self) -> int:
+        return len(self._df)
+
+    def row(self, position: int):
+        """
+        Returns the validated row at a position in the file.
+
+        Args:
+            position (int): Position of the row in the file, negative positions count from the end.
+
+        Raises:
+            IndexError: If the position is out of range.
+            ValueError: If the row fails validation.
+
+        Returns:
+            The validated model instance.
+        """
+        if position < 0:
+            position += self.row_count
+        if not 0 <= position < self.row_count:
+            raise IndexError("LazyRecords row out of range")
+
+        record = self._lookup(position)
+        if record is None:
+            record = self._validate(position, self._df.iloc[position].to_dict())
+        if record is None:
+            raise ValueError(f"Row {self._df.index[position]} failed validation: {self._failed[position]}")
+        return record
+
+    def __iter__(self):
+        for start in range(0, self.row_count, self._iteration_block):
+            # Rows are pulled out of the DataFrame a block at a time, which is far cheaper than iloc per row
+            block = self._df.iloc[start:start + self._iteration_block].to_dict('records')
+            for position, row in enumerate(block, start):
+                record = self._lookup(position)
+                if record is None and position not in self._failed:
+                    record = self._validate(position, row)
+                if record is not None:
+                    yield record
+
+    def __repr__(self) -> str:
+        return f"LazyRecords(rows={self.row_count}, validated={len(self._cache)}, errors={len(self.errors)})"
+
+    def _lookup(self, position: int):
+        record = self._cache.get(position)
+        if record is not None:
+            self._cache.move_to_end(position)
+        return record
+
+    def _validate(self, position: int, row: dict):
+        """
+        Validates a single row, caching the model instance or recording its errors.
+
+        Args:
+            position (int): Position of the row in the file.
+            row (dict): Column values of the row.
+
+        Returns:
+            The validated model instance, or None if the row is invalid.
+        """
+        if position in self._failed:
+            return None
+        try:
+            record = self._model(**row)
+        except ValidationError as e:
+            self._failed[position] = e.errors()
+            for err in e.errors():
+                self.errors.append({
+                    'row_num': self._df.index[position],
+                    'column_name': err['loc'][0] if err['loc'] else None,
+                    'error_message': err['msg']
+                })
+            return None
+
+        self._cache[position] = record
+        if self._cache_size is not None and len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+        return record
+
+
 class FileImporter:
     """
     Decorator for importing data from Excel, CSV, or JSON files into Pydantic models.
@@ -36,11 +148,240 @@ class FileImporter:
                 - 'column_name': Name of the column where the error occurred.
                 - 'error_message': Description of the validation error.
 
+        With ``lazy=True`` the first element is a LazyRecords iterable that validates rows on
+        first access, and the second is its ``errors`` list, which fills as rows are validated.
+
     """
 
+    # FileRecords model per decorated class, compiled on first import and shared afterwards
+    _compiled_models = {}
+
     def __init__(self, file_path=None):
         self.file_path = file_path
 
+    def _compile(self, cls):
+        """
+        Builds the Pydantic models for a decorated class once and reuses them for every import.
+
+        Creating the classes is what makes pydantic build the core schema and validators, so
+        doing it per call made every import pay that cost again.
+
+        Args:
+            cls (type): The decorated class, containing Pydantic model fields.
+
+        Returns:
+            type: The FileRecords model that imports and validates files for ``cls``.
+        """
+        FileRecords = self._compiled_models.get(cls)
+        if FileRecords is not None:
+            return FileRecords
+
+        # Dynamically create a Pydantic model based on the annotations
+        class DynamicModel(BaseModel, cls):
+            pass
+
+        for field, field_type in cls.__annotations__.items():
+            DynamicModel.__annotations__[field] = field_type
+
+        class FileRecords(DynamicModel):
+            @classmethod
+            def import_file(cls, file_path: str, lazy: bool = False, cache_size: Optional[int] = None,
+                            max_errors: Optional[int] = None,
+                            fail_fast: bool = False) -> tuple[list[Any], list[dict[str, Hashable | Any]]]:
+                """
+                Imports data from the specified file and validates against the Pydantic model.
+
+                Args:
+                    file_path (str): Path to the file to be imported.
+                    lazy (bool): Return a LazyRecords iterable instead of validating every row now.
+                    cache_size (int, optional): Bound on validated rows kept by LazyRecords.
+                    max_errors (int, optional): Stop validating once this many errors were collected.
+                    fail_fast (bool): Raise ValueError on the first invalid row.
+
+                Returns:
+                    tuple: A tuple containing two elements:
+                        - A list of validated Pydantic model instances.
+                        - A list of dictionaries describing validation errors.
+                """
+                return cls._process_file_flow(file_path, lazy, cache_size, max_errors, fail_fast)
+
+            @classmethod
+            def _process_file_flow(cls, file_path: str, lazy: bool = False, cache_size: Optional[int] = None,
+                                   max_errors: Optional[int] = None,
+                                   fail_fast: bool = False) -> tuple[list[Any], list[dict[str, Hashable | Any]]]:
+                """
+                Processes the specified file, performs validation, and returns results.
+
+                Args:
+                    file_path (str): Path to the file to be processed.
+                    lazy (bool): Defer row validation to first access.
+                    cache_size (int, optional): Bound on validated rows kept by LazyRecords.
+                    max_errors (int, optional): Stop validating once this many errors were collected.
+                    fail_fast (bool): Raise ValueError on the first invalid row.
+
+                Raises:
+                    ValueError: If unsupported file format or errors during file reading or validation,
+                                or if ``lazy`` is combined with ``max_errors`` or ``fail_fast``.
+
+                Returns:
+                    tuple: A tuple containing two elements:
+                        - A list of validated Pydantic model instances.
+                        - A list of dictionaries describing validation errors.
+                """
+                # Lazy rows are validated on access, there is no pass that could stop early
+                if lazy and (max_errors is not None or fail_fast):
+                    raise ValueError("lazy cannot be combined with max_errors or fail_fast")
+
+                # Determine file type
+                file_extension = os.path.splitext(file_path)[1].lower()
+
+                if file_extension in ['.xlsx', '.xls']:
+                    df = cls._read_excel_file(file_path)
+                elif file_extension == '.csv':
+                    df = cls._read_csv_file(file_path)
+                elif file_extension == '.json':
+                    df = cls._read_json_file(file_path)
+                else:
+                    raise ValueError(f"Unsupported file format {file_extension}. Please upload an Excel, CSV, or JSON file.")
+
+                df = df.replace(np.nan, None)
+                df = cls._validate_headers(df, list(DynamicModel.__annotations__.keys()))
+                if lazy:
+                    records = LazyRecords(df, FileRecords, cache_size)
+                    return records, records.errors
+                return cls._validate_inputs(df, max_errors, fail_fast)
+
+            @staticmethod
+            def _read_excel_file(file_path: str) -> pd.DataFrame:
+                """
+                Reads an Excel file and returns its contents as a pandas DataFrame.
+
+                Args:
+                    file_path (str): Path to the Excel file.
+
+                Raises:
+                    ValueError: If there is an error reading the Excel file.
+
+                Returns:
+                    pd.DataFrame: Contents of the Excel file as a pandas DataFrame.
+                """
+                try:
+                    return pd.read_excel(file_path)
+                except Exception as e:
+                    raise ValueError(f"Error reading Excel file: {e}")
+
+            @staticmethod
+            def _read_csv_file(file_path: str) -> pd.DataFrame:
+                """
+                Reads a CSV file and returns its contents as a pandas DataFrame.
+
+                Args:
+                    file_path (str): Path to the CSV file.
+
+                Raises:
+                    ValueError: If there is an error reading the CSV file.
+
+                Returns:
+                    pd.DataFrame: Contents of the CSV file as a pandas DataFrame.
+                """
+                try:
+                    return pd.read_csv(file_path)
+                except Exception as e:
+                    raise ValueError(f"Error reading CSV file: {e}")
+
+            @staticmethod
+            def _read_json_file(file_path: str) -> pd.DataFrame:
+                """
+                Reads a JSON file and returns its contents as a pandas DataFrame.
+
+                Args:
+                    file_path (str): Path to the JSON file.
+
+                Raises:
+                    ValueError: If there is an error reading the JSON file.
+
+                Returns:
+                    pd.DataFrame: Contents of the JSON file as a pandas DataFrame.
+                """
+                try:
+                    with open(file_path, 'r') as f:
+                        data = json.load(f)
+                        return pd.DataFrame(data)
+                except Exception as e:
+                    raise ValueError(f"Error reading JSON file: {e}")
+
+            @classmethod
+            def _validate_headers(cls, df: pd.DataFrame, expected_columns: List[str]) -> pd.DataFrame:
+                """
+                Validates the headers of the DataFrame against expected columns.
+
+                Args:
+                    df (pd.DataFrame): DataFrame to validate.
+                    expected_columns (List[str]): List of expected column names.
+
+                Raises:
+                    ValueError: If there are missing or extra headers in the DataFrame.
+
+                Returns:
+                    pd.DataFrame: DataFrame with validated headers.
+                """
+                actual_columns = set(df.columns)
+                if not set(expected_columns).issubset(actual_columns):
+                    raise ValueError(
+                        f"Invalid headers in the file. Expected columns: {expected_columns}, Found columns: {actual_columns}")
+                return df[expected_columns]
+
+            @classmethod
+            def _validate_inputs(cls, df: pd.DataFrame, max_errors: Optional[int] = None,
+                                 fail_fast: bool = False) -> tuple[list[cls], list[dict[str, Hashable | Any]]]:
+                """
+                Validates the data in the DataFrame against the Pydantic model.
+
+                Args:
+                    df (pd.DataFrame): DataFrame containing data to validate.
+                    max_errors (int, optional): Stop validating once this many errors were collected.
+                    fail_fast (bool): Raise ValueError on the first invalid row.
+
+                Raises:
+                    ValueError: With fail_fast, describing the first validation error.
+
+                Returns:
+                    tuple: A tuple containing two elements:
+                        - A list of validated Pydantic model instances.
+                        - A list of dictionaries describing validation errors, each dictionary containing:
+                            - 'row_num': Row number where the error occurred.
+                            - 'column_name': Name of the column where the error occurred.
+                            - 'error_message': Description of the validation error.
+                """
+                valid_data = []
+                errors = []
+
+                for index, row in df.iterrows():
+                    try:
+                        # Convert each row to a dictionary and create a BaseModel instance
+                        file_row = FileRecords(**row.to_dict())
+                        valid_data.append(file_row)
+                    except ValidationError as e:
+                        # Append error details to errors list
+                        for err in e.errors():
+                            errors.append({
+                                'row_num': index,
+                                'column_name': err['loc'][0],
+                                'error_message': err['msg']
+                            })
+                        if fail_fast:
+                            raise ValueError(f"Validation failed at row {index}: {e}")
+                        if max_errors is not None and len(errors) >= max_errors:
+                            del errors[max_errors:]
+                            break
+
+                return valid_data, errors
+
+        # Replace import_file method in the original class with FileRecords import_file method
+        cls.import_file = FileRecords.import_file
+        self._compiled_models[cls] = FileRecords
+        return FileRecords
+
     def __call__(self, cls):
         """
         Decorator function that wraps around a class and adds file import functionality.
@@ -58,7 +399,10 @@ class FileImporter:
             Args:
                 *args: Positional arguments passed to the decorated class constructor.
                 **kwargs: Keyword arguments passed to the decorated class constructor,
-                          including 'filepath' to override default file path.
+                          including 'filepath' to override default file path. 'lazy' and
+                          'cache_size' select a LazyRecords result, 'max_errors' stops validation
+                          once that many errors were found and 'fail_fast' raises ValueError on
+                          the first invalid row. These are consumed here.
 
             Raises:
                 ValueError: If file path is empty, unsupported file format, or errors during
@@ -71,183 +415,21 @@ class FileImporter:
             """
             # Extract and store filepath from kwargs or use the default filepath
             filepath = kwargs.get('filepath', self.file_path)
+            lazy = kwargs.pop('lazy', False)
+            cache_size = kwargs.pop('cache_size', None)
+            max_errors = kwargs.pop('max_errors', None)
+            fail_fast = kwargs.pop('fail_fast', False)
 
             if not filepath:
                 raise ValueError("Filepath is required for import_file")
 
-            # Dynamically create a Pydantic model based on the annotations
-            class DynamicModel(BaseModel, cls):
-                pass
-
-            for field, field_type in cls.__annotations__.items():
-                DynamicModel.__annotations__[field] = field_type
-
-            class FileRecords(DynamicModel):
-                @classmethod
-                def import_file(cls) -> tuple[list[Any], list[dict[str, Hashable | Any]]]:
-                    """
-                    Imports data from the specified file and validates against the Pydantic model.
-
-                    Returns:
-                        tuple: A tuple containing two elements:
-                            - A list of validated Pydantic model instances.
-                            - A list of dictionaries describing validation errors.
-                    """
-                    return cls._process_file_flow(filepath)
-
-                @classmethod
-                def _process_file_flow(cls, file_path: str) -> tuple[list[Any], list[dict[str, Hashable | Any]]]:
-                    """
-                    Processes the specified file, performs validation, and returns results.
-
-                    Args:
-                        file_path (str): Path to the file to be processed.
-
-                    Raises:
-                        ValueError: If unsupported file format or errors during file reading or validation.
-
-                    Returns:
-                        tuple: A tuple containing two elements:
-                            - A list of validated Pydantic model instances.
-                            - A list of dictionaries describing validation errors.
-                    """
-                    # Determine file type
-                    file_extension = os.path.splitext(filepath)[1].lower()
-
-                    if file_extension in ['.xlsx', '.xls']:
-                        df = cls._read_excel_file(file_path)
-                    elif file_extension == '.csv':
-                        df = cls._read_csv_file(file_path)
-                    elif file_extension == '.json':
-                        df = cls._read_json_file(file_path)
-                    else:
-                        raise ValueError(f"Unsupported file format {file_extension}. Please upload an Excel, CSV, or JSON file.")
-
-                    df = df.replace(np.nan, None)
-                    df = cls._validate_headers(df, list(DynamicModel.__annotations__.keys()))
-                    return cls._validate_inputs(df)
-
-                @staticmethod
-                def _read_excel_file(file_path: str) -> pd.DataFrame:
-                    """
-                    Reads an Excel file and returns its contents as a pandas DataFrame.
-
-                    Args:
-                        file_path (str): Path to the Excel file.
-
-                    Raises:
-                        ValueError: If there is an error reading the Excel file.
-
-                    Returns:
-                        pd.DataFrame: Contents of the Excel file as a pandas DataFrame.
-                    """
-                    try:
-                        return pd.read_excel(file_path)
-                    except Exception as e:
-                        raise ValueError(f"Error reading Excel file: {e}")
-
-                @staticmethod
-                def _read_csv_file(file_path: str) -> pd.DataFrame:
-                    """
-                    Reads a CSV file and returns its contents as a pandas DataFrame.
-
-                    Args:
-                        file_path (str): Path to the CSV file.
-
-                    Raises:
-                        ValueError: If there is an error reading the CSV file.
-
-                    Returns:
-                        pd.DataFrame: Contents of the CSV file as a pandas DataFrame.
-                    """
-                    try:
-                        return pd.read_csv(file_path)
-                    except Exception as e:
-                        raise ValueError(f"Error reading CSV file: {e}")
-
-                @staticmethod
-                def _read_json_file(file_path: str) -> pd.DataFrame:
-                    """
-                    Reads a JSON file and returns its contents as a pandas DataFrame.
-
-                    Args:
-                        file_path (str): Path to the JSON file.
-
-                    Raises:
-                        ValueError: If there is an error reading the JSON file.
-
-                    Returns:
-                        pd.DataFrame: Contents of the JSON file as a pandas DataFrame.
-                    """
-                    try:
-                        with open(file_path, 'r') as f:
-                            data = json.load(f)
-                            return pd.DataFrame(data)
-                    except Exception as e:
-                        raise ValueError(f"Error reading JSON file: {e}")
-
-                @classmethod
-                def _validate_headers(cls, df: pd.DataFrame, expected_columns: List[str]) -> pd.DataFrame:
-                    """
-                    Validates the headers of the DataFrame against expected columns.
-
-                    Args:
-                        df (pd.DataFrame): DataFrame to validate.
-                        expected_columns (List[str]): List of expected column names.
-
-                    Raises:
-                        ValueError: If there are missing or extra headers in the DataFrame.
-
-                    Returns:
-                        pd.DataFrame: DataFrame with validated headers.
-                    """
-                    actual_columns = set(df.columns)
-                    if not set(expected_columns).issubset(actual_columns):
-                        raise ValueError(
-                            f"Invalid headers in the file. Expected columns: {expected_columns}, Found columns: {actual_columns}")
-                    return df[expected_columns]
-
-                @classmethod
-                def _validate_inputs(cls, df: pd.DataFrame) -> tuple[list[cls], list[dict[str, Hashable | Any]]]:
-                    """
-                    Validates the data in the DataFrame against the Pydantic model.
-
-                    Args:
-                        df (pd.DataFrame): DataFrame containing data to validate.
-
-                    Returns:
-                        tuple: A tuple containing two elements:
-                            - A list of validated Pydantic model instances.
-                            - A list of dictionaries describing validation errors, each dictionary containing:
-                                - 'row_num': Row number where the error occurred.
-                                - 'column_name': Name of the column where the error occurred.
-                                - 'error_message': Description of the validation error.
-                    """
-                    valid_data = []
-                    errors = []
-
-                    for index, row in df.iterrows():
-                        try:
-                            # Convert each row to a dictionary and create a BaseModel instance
-                            file_row = FileRecords(**row.to_dict())
-                            valid_data.append(file_row)
-                        except ValidationError as e:
-                            # Append error details to errors list
-                            for err in e.errors():
-                                errors.append({
-                                    'row_num': index,
-                                    'column_name': err['loc'][0],
-                                    'error_message': err['msg']
-                                })
-
-                    return valid_data, errors
-
-            # Replace import_file method in the original class with FileRecords import_file method
-            cls.import_file = FileRecords.import_file
+            # Compiles the models on the first import only, later imports reuse them
+            self._compile(cls)
 
             # Initialize the decorated class and return the validated data directly
             instance = cls(*args, **kwargs)
-            return instance.import_file()
+            return instance.import_file(filepath, lazy=lazy, cache_size=cache_size, max_errors=max_errors,
+                                        fail_fast=fail_fast)
 
         return wrapper
 
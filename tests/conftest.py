@@ -0,0 +1,10 @@
+import os
+import sys
+import types
+
+# The repository root is the Utilities package, register it so tests import it the way the app does
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if 'Utilities' not in sys.modules:
+    package = types.ModuleType('Utilities')
+    package.__path__ = [ROOT]
+    sys.modules['Utilities'] = package
@@ -0,0 +1,114 @@
+import os
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from Utilities.File_IO import FileImporter, ImportCache, RecordStore, Validator
+
+
+class Row(BaseModel):
+    name: str
+    prod: Optional[int] = None
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ImportCache(cache_dir=str(tmp_path / 'cache'))
+
+
+def write_csv(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_columnar_import_caches_columns(tmp_path, cache, monkeypatch):
+    path = write_csv(tmp_path / 'rows.csv', 'name,prod\na,1\nb,x\nc,\n')
+    importer = FileImporter(cache=cache)(Row)
+
+    def no_models(self):
+        raise AssertionError("columnar imports must not build models to cache them")
+
+    monkeypatch.setattr(RecordStore, 'to_models', no_models)
+    first, first_errors = importer(path, columnar=True)
+    second, second_errors = importer(path, columnar=True)
+
+    assert isinstance(second, RecordStore)
+    assert second.to_frame().equals(first.to_frame())
+    assert list(second_errors) == list(first_errors)
+    assert [row.prod for row in second] == [1, None]
+
+
+def test_model_import_ignores_cached_columns(tmp_path, cache):
+    path = write_csv(tmp_path / 'rows.csv', 'name,prod\na,1\nc,\n')
+    importer = FileImporter(cache=cache)(Row)
+
+    importer(path, columnar=True)
+    assert cache.get(path, Row) is None
+    valid_data, _ = importer(path)
+
+    assert valid_data == [Row(name='a', prod=1), Row(name='c')]
+    assert cache.get(path, Row) is not None
+
+
+def test_cache_hit_skips_validation(tmp_path, cache, monkeypatch):
+    path = write_csv(tmp_path / 'rows.csv', 'name,prod\na,1\nb,x\n')
+    importer = FileImporter(cache=cache)(Row)
+    valid_data, errors = importer(path)
+
+    def no_validation(*args, **kwargs):
+        raise AssertionError("a cache hit must not validate")
+
+    monkeypatch.setattr(Validator, 'validate_records', no_validation)
+    monkeypatch.setattr(Validator, 'validate_inputs', no_validation)
+    cached_valid, cached_errors = importer(path)
+
+    assert cached_valid == valid_data == [Row(name='a', prod=1)]
+    assert cached_errors == errors
+    assert cached_errors[0]['row'] == 2
+
+
+def test_changed_file_is_not_served_from_cache(tmp_path, cache):
+    path = write_csv(tmp_path / 'rows.csv', 'name,prod\na,1\n')
+    importer = FileImporter(cache=cache)(Row)
+    importer(path)
+
+    write_csv(tmp_path / 'rows.csv', 'name,prod\na,1\nb,22\n')
+    valid_data, _ = importer(path)
+
+    assert [row.name for row in valid_data] == ['a', 'b']
+    # The entry of the previous file content was replaced, not kept next to the new one
+    assert len(os.listdir(cache.cache_dir)) == 1
+
+
+def test_invalidate(tmp_path, cache):
+    first = write_csv(tmp_path / 'first.csv', 'name,prod\na,1\n')
+    second = write_csv(tmp_path / 'second.csv', 'name,prod\nb,2\n')
+    importer = FileImporter(cache=cache)(Row)
+    importer(first)
+    importer(second)
+
+    assert cache.invalidate(first) == 1
+    assert cache.get(first, Row) is None
+    assert cache.get(second, Row) is not None
+    assert cache.invalidate() == 1
+    assert cache.get(second, Row) is None
+
+
+def test_eviction_drops_least_recently_used(tmp_path, cache):
+    paths = [write_csv(tmp_path / f'{name}.csv', f'name,prod\n{name},1\n') for name in 'abc']
+    importer = FileImporter(cache=cache)(Row)
+    importer(paths[0])
+    entry_size = sum(entry.stat().st_size for entry in os.scandir(cache.cache_dir))
+    cache.max_bytes = 2 * entry_size
+
+    importer(paths[1])
+    os.utime(next(entry.path for entry in os.scandir(cache.cache_dir)
+                  if entry.name.startswith(cache._path_prefix(paths[1]))), ns=(0, 0))
+    # A hit touches its entry, so the first file is now more recent than the second
+    importer(paths[0])
+    importer(paths[2])
+
+    assert cache.get(paths[0], Row) is not None
+    assert cache.get(paths[1], Row) is None
+    assert cache.get(paths[2], Row) is not None
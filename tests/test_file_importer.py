@@ -0,0 +1,49 @@
+from typing import Optional
+
+import pytest
+
+from Utilities.file_importer import FileImporter, LazyRecords
+
+
+@FileImporter()
+class Row:
+    name: str
+    prod: Optional[int] = None
+
+    def __init__(self, filepath: Optional[str] = None):
+        self.filepath = filepath
+
+
+@pytest.fixture
+def rows_csv(tmp_path):
+    path = tmp_path / 'rows.csv'
+    path.write_text('name,prod\na,1\nb,x\nc,3\n')
+    return str(path)
+
+
+def test_lazy_iteration_matches_eager_import(rows_csv):
+    eager, eager_errors = Row(filepath=rows_csv)
+    records, errors = Row(filepath=rows_csv, lazy=True)
+
+    assert isinstance(records, LazyRecords)
+    assert [row.name for row in records] == [row.name for row in eager] == ['a', 'c']
+    assert errors == eager_errors
+    assert records.row_count == 3
+
+
+def test_lazy_row_access(rows_csv):
+    records, errors = Row(filepath=rows_csv, lazy=True)
+
+    assert records.row(0).name == 'a'
+    assert records.row(-1).name == 'c'
+    with pytest.raises(ValueError):
+        records.row(1)
+    with pytest.raises(IndexError):
+        records.row(3)
+    assert [error['column_name'] for error in errors] == ['prod']
+
+
+@pytest.mark.parametrize('options', [{'max_errors': 1}, {'fail_fast': True}])
+def test_lazy_rejects_early_stop_options(rows_csv, options):
+    with pytest.raises(ValueError, match='lazy'):
+        Row(filepath=rows_csv, lazy=True, **options)
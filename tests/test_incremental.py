@@ -0,0 +1,84 @@
+from typing import Optional
+
+import pytest
+import toml
+from pydantic import BaseModel
+
+from Utilities.File_IO import FileImporter
+from Utilities.TOMLConfigLader import ConfigLoader
+
+
+@FileImporter()
+class Row(BaseModel):
+    name: str
+    prod: Optional[int] = None
+
+
+SITE_CONFIG = {'subscription': {'env': {'prod': {'url': 'https://example.com'}}}}
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    # The row index, snapshot and SiteConfig folder all live relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def write_csv(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def test_duplicate_keys_keep_their_own_rows(workdir):
+    path = write_csv(workdir / 'rows.csv', 'name,prod\na,1\na,2\n')
+
+    Row(path, incremental=True)
+    valid_data, errors, diff = Row(path, incremental=True)
+
+    assert [row.prod for row in valid_data] == [1, 2]
+    assert errors == []
+    assert diff == {'added': [], 'changed': [], 'removed': []}
+
+
+def test_duplicate_key_change_is_reported(workdir):
+    path = write_csv(workdir / 'rows.csv', 'name,prod\na,1\na,2\n')
+    Row(path, incremental=True)
+
+    write_csv(workdir / 'rows.csv', 'name,prod\na,1\na,3\n')
+    valid_data, _, diff = Row(path, incremental=True)
+
+    assert [row.prod for row in valid_data] == [1, 3]
+    assert diff == {'added': [], 'changed': ['a'], 'removed': []}
+
+
+def test_refresh_diffs_against_the_loaders_own_rows(workdir):
+    (workdir / 'SiteConfig').mkdir()
+    (workdir / 'SiteConfig' / 'a.toml').write_text(toml.dumps(SITE_CONFIG))
+    path = write_csv(workdir / 'input.csv', 'name,prod,dev,stage\na,2,,\n')
+
+    first = ConfigLoader(path, snapshot=False)
+    second = ConfigLoader(path, snapshot=False)
+    write_csv(workdir / 'input.csv', 'name,prod,dev,stage\na,1,,\n')
+
+    # The second loader moves the shared row index on first, the first loader must still see its change
+    assert second.refresh()['changed'] == ['a']
+    assert first.refresh()['changed'] == ['a']
+    assert first.configs['a'].env.prod.update_status == 'updated'
+
+
+def test_poll_rebuilds_after_another_loader_refreshed(workdir):
+    (workdir / 'SiteConfig').mkdir()
+    (workdir / 'SiteConfig' / 'a.toml').write_text(toml.dumps(SITE_CONFIG))
+    path = write_csv(workdir / 'input.csv', 'name,prod,dev,stage\na,2,,\n')
+
+    watched = ConfigLoader(path, snapshot=False)
+    other = ConfigLoader(path, snapshot=False)
+    write_csv(workdir / 'input.csv', 'name,prod,dev,stage\na,1,,\nb,1,,\n')
+    other.refresh()
+
+    state = watched.state
+    assert watched.poll() == ['a', 'b']
+    assert watched.configs['a'].env.prod.update_status == 'updated'
+    # Readers holding the previous state keep a consistent pair
+    assert state.configs['a'] is state.config_objects[0]
+    assert state.configs['a'].env.prod.update_status == 'post_updated'
@@ -0,0 +1,118 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from Utilities.File_IO import FileImporter, JSONFileReader, sniff_format
+
+from conftest import ROOT
+
+
+def write(path, content):
+    if isinstance(content, str):
+        path.write_text(content)
+    else:
+        path.write_bytes(content)
+    return str(path)
+
+
+@pytest.mark.parametrize('content, expected', [
+    (b'PK\x03\x04rest', '.xlsx'),
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1rest', '.xls'),
+    (b'PAR1rest', '.parquet'),
+    ('name,prod\na,1\n', '.csv'),
+    ('﻿  [{"name": "a"}]', '.json'),
+    ('{\n  "name": "a"\n}\n', '.json'),
+    ('{"name": "a"}\n{"name": "b"}\n', '.ndjson'),
+    ('{"name": "a"}\n', '.json'),
+    ('plain text\n', None),
+])
+def test_sniff_format(tmp_path, content, expected):
+    assert sniff_format(write(tmp_path / 'data', content)) == expected
+
+
+def test_sniff_format_missing_file(tmp_path):
+    assert sniff_format(str(tmp_path / 'missing.csv')) is None
+
+
+@pytest.mark.parametrize('name, content, expected', [
+    # Binary content wins over the extension
+    ('export.xls', 'name,prod\na,1\n', '.csv'),
+    ('data.csv', b'PK\x03\x04rest', '.xlsx'),
+    # An alias of the detected format keeps its extension
+    ('data.xlsm', b'PK\x03\x04rest', '.xlsm'),
+    # Between two text formats the extension wins
+    ('data.json', '{"name": "a"}\n{"name": "b"}\n', '.json'),
+    ('data.csv', '[{"name": "a"}]', '.csv'),
+    # Nothing detected keeps the extension
+    ('data.csv', 'plain text\n', '.csv'),
+])
+def test_extension_precedence(tmp_path, name, content, expected):
+    extension, reader = FileImporter()._reader_for(write(tmp_path / name, content))
+
+    assert extension == expected
+    assert reader is FileImporter._file_readers[expected]
+
+
+def test_cold_process_multi_file_import(tmp_path):
+    # pandas is first imported by the pool workers reading the files at once
+    (tmp_path / 'multi').mkdir()
+    for i in range(16):
+        write(tmp_path / 'multi' / f'f{i}.csv', f'name,prod\na{i},1\nb{i},x\n')
+    os.symlink(ROOT, tmp_path / 'Utilities')
+    script = textwrap.dedent('''
+        import sys
+        from typing import Optional
+        from pydantic import BaseModel
+        from Utilities.File_IO import FileImporter
+
+        assert 'pandas' not in sys.modules
+
+        @FileImporter()
+        class Row(BaseModel):
+            name: str
+            prod: Optional[int] = None
+
+        valid_data, errors = Row('multi', max_workers=16)
+        print(len(valid_data), len(errors))
+    ''')
+
+    result = subprocess.run([sys.executable, '-c', script], cwd=tmp_path, capture_output=True, text=True,
+                            env={**os.environ, 'PYTHONPATH': str(tmp_path)})
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split()[-2:] == ['16', '16']
+
+
+@pytest.mark.parametrize('block_size', [1, 2, 3, 7, 1 << 16])
+@pytest.mark.parametrize('text', [
+    '[]',
+    ' [ ] ',
+    '[{"name": "a]", "prod": 1}, {"name": ",b,", "prod": 2}]',
+    '[{"name": "a", "prod": 123456789}, {"name": "b", "prod": -1.5e10}]',
+    '[1234567, 0.000125, true, false, null, "x\\"]"]',
+    '\n\n    [\n  {"name": "a"},\n  {"name": "b"}\n]\n',
+])
+def test_json_array_across_blocks(tmp_path, block_size, text):
+    reader = JSONFileReader()
+    reader.block_size = block_size
+    path = write(tmp_path / 'rows.json', text)
+
+    chunks = list(reader.iter_records(path, 2))
+
+    assert [record for _, records in chunks for record in records] == json.loads(text)
+    assert [row for index, _ in chunks for row in index] == list(range(len(json.loads(text))))
+    assert all(len(records) <= 2 for _, records in chunks)
+
+
+@pytest.mark.parametrize('block_size', [1, 3, 1 << 16])
+@pytest.mark.parametrize('text', ['[{"name": "a"}', '[{"name": "a"}, {"name": "b', '[1, 2', '[{"name": "a"},'])
+def test_json_array_truncated(tmp_path, block_size, text):
+    reader = JSONFileReader()
+    reader.block_size = block_size
+
+    with pytest.raises(ValueError):
+        list(reader.iter_records(write(tmp_path / 'rows.json', text), 2))
@@ -0,0 +1,75 @@
+from typing import ClassVar, List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+from pydantic import BaseModel, Field, field_validator
+
+from Utilities.File_IO import FileImporter, Validator
+
+
+class Row(BaseModel):
+    name: str
+    prod: Optional[int] = None
+    to_test: int = Field(default=0, ge=0, le=1)
+
+
+class CountingRow(BaseModel):
+    name: str
+    calls: ClassVar[List[str]] = []
+
+    @field_validator('name')
+    @classmethod
+    def count(cls, value):
+        cls.calls.append(value)
+        return value
+
+
+FRAME = pd.DataFrame({
+    'name': ['a', None, 'c', 'd'],
+    'prod': [1, 2, 'x', None],
+    'to_test': [0, 1, 5, 1],
+}).astype(object).replace({float('nan'): None})
+
+
+def test_batch_errors_match_validate_row():
+    batch_valid, batch_errors = Validator.validate_inputs(FRAME, Row, 'batch')
+    row_valid, row_errors = Validator.validate_inputs(FRAME, Row, 'thread')
+
+    assert batch_valid == row_valid
+    assert list(batch_errors) == list(row_errors)
+    assert [(error['row'], error['column']) for error in batch_errors] == [(2, 'name'), (3, 'prod'), (3, 'to_test')]
+
+
+def test_batch_validates_each_row_once():
+    CountingRow.calls.clear()
+    valid_data, errors = Validator.validate_records([{'name': 'a'}, {'name': 'b'}, {'name': 5}], CountingRow)
+
+    assert [row.name for row in valid_data] == ['a', 'b']
+    assert len(errors) == 1
+    assert CountingRow.calls == ['a', 'b']
+
+
+RECORDS = [
+    {'name': 'a', 'prod': 1, 'to_test': 0},
+    {'name': 'b', 'prod': float('nan'), 'to_test': 1},
+    {'name': None, 'prod': 'x', 'to_test': 0},
+    {'name': 'd', 'to_test': 5},
+]
+
+
+@pytest.mark.parametrize('data', [
+    RECORDS,
+    {'name': ['a', 'b', None], 'prod': np.array([1, 2, 3]), 'to_test': (0, 1, 7)},
+    {'name': 'a', 'prod': 'x', 'to_test': 1},
+])
+def test_record_fast_path_matches_dataframe_path(data):
+    importer = FileImporter()(Row)
+    frame = pd.DataFrame.from_records(data) if isinstance(data, list) else pd.DataFrame(
+        data, index=[0] if all(np.isscalar(value) for value in data.values()) else None)
+
+    valid_data, errors = importer(data)
+    frame_valid, frame_errors = importer(frame)
+
+    assert valid_data == frame_valid
+    assert errors == frame_errors